@@ -0,0 +1,35 @@
+"""Add composite index for the trainings list ordering
+
+Revision ID: 002_trainings_brand_start
+Revises: 001_mailbox
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_trainings_brand_start'
+down_revision = '001_mailbox'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NULLS LAST in index definitions is PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.create_index(
+        'ix_trainings_brand_id_start_date',
+        'trainings',
+        ['brand_id', sa.text('start_date DESC NULLS LAST')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_trainings_brand_id_start_date', table_name='trainings')
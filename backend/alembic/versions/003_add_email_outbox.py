@@ -0,0 +1,37 @@
+"""Add email outbox table
+
+Revision ID: 003_email_outbox
+Revises: 002_trainings_brand_start
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_email_outbox'
+down_revision = '002_trainings_brand_start'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'email_outbox',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('to_address', sa.String(255), nullable=False),
+        sa.Column('subject', sa.String(500), nullable=False),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('next_try_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_email_outbox_id', 'email_outbox', ['id'], unique=False)
+    op.create_index('ix_email_outbox_status_next_try_at', 'email_outbox', ['status', 'next_try_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table('email_outbox')
@@ -0,0 +1,36 @@
+"""Add composite indexes for the mailbox listing
+
+Revision ID: 004_mailbox_listing
+Revises: 003_email_outbox
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_mailbox_listing'
+down_revision = '003_email_outbox'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_mailbox_owner_folder_received',
+        'mailbox_emails',
+        ['owner_id', 'folder', sa.text('received_at DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_mailbox_owner_unread',
+        'mailbox_emails',
+        ['owner_id', sa.text('received_at DESC')],
+        unique=False,
+        postgresql_where=sa.text("folder = 'inbox' AND is_read = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_mailbox_owner_unread', table_name='mailbox_emails')
+    op.drop_index('ix_mailbox_owner_folder_received', table_name='mailbox_emails')
@@ -0,0 +1,45 @@
+"""Add trigram indexes for the global search
+
+Revision ID: 005_search_trgm
+Revises: 004_mailbox_listing
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005_search_trgm'
+down_revision = '004_mailbox_listing'
+branch_labels = None
+depends_on = None
+
+# Columns matched by search_everywhere() with lower(column) LIKE '%query%'
+SEARCH_COLUMNS = {
+    'customers': ['company_name', 'first_name', 'last_name', 'contact_email', 'tags'],
+    'trainers': ['first_name', 'last_name', 'email', 'tags'],
+    'trainings': ['title', 'location', 'communication_notes', 'internal_notes'],
+}
+
+
+def upgrade() -> None:
+    # pg_trgm is PostgreSQL-only; SQLite keeps scanning
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            # Expression must match the query exactly for the planner to use it
+            op.execute(
+                f'CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm '
+                f'ON {table} USING gin (lower({column}) gin_trgm_ops)'
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            op.execute(f'DROP INDEX IF EXISTS ix_{table}_{column}_trgm')
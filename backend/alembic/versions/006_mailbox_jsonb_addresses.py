@@ -0,0 +1,60 @@
+"""Store mailbox address lists as JSON(B)
+
+Revision ID: 006_mailbox_jsonb
+Revises: 005_search_trgm
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '006_mailbox_jsonb'
+down_revision = '005_search_trgm'
+branch_labels = None
+depends_on = None
+
+ADDRESS_COLUMNS = ('to_addresses', 'cc_addresses', 'bcc_addresses')
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    address_type = postgresql.JSONB() if is_postgresql else sa.JSON()
+
+    # The existing TEXT values already hold JSON arrays; only NULLs need filling
+    for column in ADDRESS_COLUMNS:
+        op.execute(f"UPDATE mailbox_emails SET {column} = '[]' WHERE {column} IS NULL")
+
+    with op.batch_alter_table('mailbox_emails') as batch_op:
+        for column in ADDRESS_COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Text(),
+                type_=address_type,
+                nullable=False,
+                server_default='[]',
+                postgresql_using=f'{column}::jsonb',
+            )
+
+    if is_postgresql:
+        op.create_index('ix_mailbox_to_gin', 'mailbox_emails', ['to_addresses'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    address_type = postgresql.JSONB() if is_postgresql else sa.JSON()
+
+    if is_postgresql:
+        op.drop_index('ix_mailbox_to_gin', table_name='mailbox_emails')
+
+    with op.batch_alter_table('mailbox_emails') as batch_op:
+        for column in ADDRESS_COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=address_type,
+                type_=sa.Text(),
+                nullable=column != 'to_addresses',
+                server_default=None,
+                postgresql_using=f'{column}::text',
+            )
@@ -32,6 +32,7 @@ class Settings(BaseSettings):
     smtp_from_email: str = "noreply@yellow-boat.org"
     smtp_from_name: str = "Yellow-Boat Academy"
     email_enabled: bool = False  # Set to True when SMTP is configured
+    smtp_max_emails_per_connection: int = 4500  # Providers throttle long sessions (SendGrid: 5000)
 
     # IMAP settings for receiving emails
     imap_host: str = ""
@@ -21,10 +21,13 @@ def get_db() -> Session:
     """
     Dependency to get database session.
 
+    Objects are not expired on commit: write endpoints return the instance
+    they just flushed, so reloading it with another SELECT is unnecessary.
+
     Yields:
         Database session
     """
-    db = SessionLocal()
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -109,9 +112,11 @@ def require_role(*allowed_roles: UserRole) -> Callable:
         async def admin_endpoint(user: User = Depends(require_role(UserRole.ADMIN))):
             return {"message": "Admin only"}
     """
+    allowed_values = frozenset(role.value for role in allowed_roles)
+
     async def role_checker(current_user: User = Depends(get_current_active_user)) -> User:
         """Check if user has required role."""
-        if UserRole(current_user.role) not in allowed_roles:
+        if current_user.role not in allowed_values:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required roles: {', '.join(r.value for r in allowed_roles)}"
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.pool import QueuePool
 
@@ -22,6 +22,7 @@ try:
         engine = create_engine(
             settings.database_url,
             connect_args=connect_args,
+            query_cache_size=1200,
             echo=False
         )
     else:
@@ -32,6 +33,7 @@ try:
             max_overflow=10,
             pool_timeout=30,
             pool_recycle=1800,
+            query_cache_size=1200,
             echo=False
         )
     logger.info(f"Database engine created successfully for {settings.database_url.split('@')[-1] if '@' in settings.database_url else 'sqlite'}")
@@ -39,6 +41,15 @@ except Exception as e:
     logger.error(f"Failed to create database engine: {e}")
     raise
 
+if settings.database_url.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        # SQLite only enforces foreign keys (and their ON DELETE CASCADE) when
+        # enabled per connection; PostgreSQL always does
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
 
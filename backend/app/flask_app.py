@@ -1,16 +1,22 @@
 """Flask application - WSGI compatible version of Trainings Backoffice."""
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+import orjson
 from flask import Flask, jsonify, request, g, render_template
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from jinja2 import TemplateNotFound
 from sqlalchemy.orm import Session
 from collections import defaultdict
 import time
@@ -21,11 +27,37 @@ MAX_LOGIN_ATTEMPTS = 5  # Max attempts per window
 LOGIN_WINDOW_SECONDS = 300  # 5 minute window
 LOCKOUT_SECONDS = 900  # 15 minute lockout after max attempts
 
-# Configure logging
+# Configure logging: records are queued and written to stderr by a background
+# thread, so a slow or contended stderr doesn't block request handling
+_log_handler = QueueHandler(queue.SimpleQueue())
+_log_listener: QueueListener | None = None
+
+
+def start_log_listener() -> None:
+    """
+    Give this process a fresh log queue and a thread draining it to stderr.
+
+    Runs at import and again in every forked child: a pre-fork server imports
+    the app in the master, and the listener thread doesn't survive the fork.
+    """
+    global _log_listener
+    _log_handler.queue = queue.SimpleQueue()
+    _log_listener = QueueListener(_log_handler.queue, logging.StreamHandler(sys.stderr))
+    _log_listener.start()
+
+
+def _stop_log_listener() -> None:
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+start_log_listener()
+os.register_at_fork(after_in_child=start_log_listener)
+atexit.register(_stop_log_listener)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stderr)]
+    handlers=[_log_handler]
 )
 logger = logging.getLogger(__name__)
 
@@ -48,7 +80,8 @@ from .services.email import (
     send_training_application_submitted,
     send_training_application_accepted as send_training_app_accepted,
     send_training_application_rejected as send_training_app_rejected,
-    send_training_application_admin_notification
+    send_training_application_admin_notification,
+    email_queue,
 )
 
 # Create tables
@@ -63,7 +96,33 @@ APP_DIR = Path(__file__).parent.absolute()
 TEMPLATE_DIR = APP_DIR / 'templates'
 STATIC_DIR = APP_DIR / 'static'
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes responses and parses requests with orjson.
+
+    Output matches the default provider: keys are sorted, and dates are still
+    handed to the default hook, so they keep Flask's HTTP-date format.
+    """
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            # Indented output for debugging
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
 app = Flask(__name__, template_folder=str(TEMPLATE_DIR), static_folder=str(STATIC_DIR))
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = settings.secret_key
 
 # Configure CORS
@@ -74,6 +133,8 @@ CORS(app, origins=settings.cors_origins, supports_credentials=True)
 @app.before_request
 def before_request():
     g.db = SessionLocal()
+    # No-op once running; (re)starts the outbox worker in each server process
+    email_queue.start()
 
 
 @app.teardown_request
@@ -155,32 +216,40 @@ def admin_required(f):
 
 # ============== Basic Routes ==============
 
+@lru_cache(maxsize=None)
+def render_static_page(template_name: str) -> str:
+    """Render a page that uses no template variables once and reuse the HTML."""
+    return render_template(template_name)
+
+
 @app.route('/')
 def root():
     """Serve the admin frontend."""
-    template_path = TEMPLATE_DIR / 'index.html'
-    if not template_path.exists():
+    try:
+        return render_static_page('index.html')
+    except TemplateNotFound:
+        template_path = TEMPLATE_DIR / 'index.html'
         return jsonify({
             "error": "Template not found",
             "template_path": str(template_path),
             "template_dir": str(TEMPLATE_DIR),
             "exists": template_path.exists()
         }), 500
-    return render_template('index.html')
 
 
 @app.route('/login')
 def login_page():
     """Serve the login landing page."""
-    template_path = TEMPLATE_DIR / 'login.html'
-    if not template_path.exists():
+    try:
+        return render_static_page('login.html')
+    except TemplateNotFound:
+        template_path = TEMPLATE_DIR / 'login.html'
         return jsonify({
             "error": "Login template not found",
             "template_path": str(template_path),
             "template_dir": str(TEMPLATE_DIR),
             "exists": template_path.exists()
         }), 500
-    return render_template('login.html')
 
 
 @app.route('/api')
@@ -1836,15 +1905,10 @@ def test_alwaysdata_connection():
         return jsonify({"success": False, "error": "Domain ID not configured (is 0)"})
 
     try:
-        import requests
-        from .services.alwaysdata import get_api_auth, ALWAYSDATA_API_URL
+        from .services.alwaysdata import get_client
 
         # Test: List existing mailboxes
-        response = requests.get(
-            f"{ALWAYSDATA_API_URL}/mailbox/",
-            auth=get_api_auth(),
-            timeout=30
-        )
+        response = get_client().get("/mailbox/")
 
         return jsonify({
             "success": response.status_code == 200,
@@ -1864,6 +1928,7 @@ def test_smtp_connection():
         return jsonify({'error': 'Admin access required'}), 403
 
     from .config import settings
+    from .services.email import SMTPConnection
     import smtplib
 
     if not settings.smtp_host:
@@ -1873,15 +1938,16 @@ def test_smtp_connection():
         return jsonify({"success": False, "error": "SMTP credentials not configured"})
 
     try:
-        # Try to connect and authenticate
-        if settings.smtp_use_tls:
-            server = smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=30)
-            server.starttls()
-        else:
-            server = smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=30)
-
-        server.login(settings.smtp_username, settings.smtp_password)
-        server.quit()
+        # Try to connect and authenticate with a fresh (unpooled) connection
+        connection = SMTPConnection(
+            settings.smtp_host,
+            settings.smtp_port,
+            settings.smtp_use_tls,
+            settings.smtp_username,
+            settings.smtp_password,
+        )
+        connection.ensure_connected()
+        connection.close()
 
         return jsonify({
             "success": True,
@@ -2414,9 +2480,10 @@ Application ID: {application.id}""",
 
         return jsonify({"status": "success", "message": "Bewerbung erfolgreich eingereicht", "id": application.id}), 201
 
-    except Exception as e:
-        logging.error(f"Error submitting trainer application: {str(e)}", exc_info=True)
-        return jsonify({"error": f"Fehler beim Einreichen der Bewerbung: {str(e)}"}), 500
+    except Exception:
+        logger.exception("Error submitting trainer application")
+        # Public endpoint: don't echo internal error details to the applicant
+        return jsonify({"error": "Fehler beim Einreichen der Bewerbung. Bitte versuche es später erneut."}), 500
 
 
 @app.route('/trainer/applications')
@@ -2516,7 +2583,9 @@ def approve_trainer_application(app_id):
         from .services.alwaysdata import create_user_mailbox, send_credentials_email
 
         # Get list of existing platform emails to avoid duplicates
-        existing_emails = [u.platform_email for u in db.query(User).filter(User.platform_email.isnot(None)).all()]
+        existing_emails = {
+            email for (email,) in db.query(User.platform_email).filter(User.platform_email.isnot(None))
+        }
 
         success, platform_email, email_password = create_user_mailbox(
             application.last_name,
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 # Configure logging
@@ -20,6 +21,7 @@ from .config import settings
 from .database import Base, SessionLocal, engine
 from .models import ActivityLog, Brand, Customer, EmailTemplate, Trainer, Training, TrainingCatalogEntry, TrainingTask, User
 from .routers import auth, brands, catalog, customers, emails, search, tasks, trainers, trainings
+from .services.email import close_async_smtp_connection, close_smtp_connections, email_queue
 
 # Create tables with error handling
 try:
@@ -32,7 +34,8 @@ except Exception as e:
 app = FastAPI(
     title=settings.app_name,
     description="Trainings Backoffice API with Authentication",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -45,6 +48,19 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+def start_email_queue():
+    # Send whatever is left in the outbox from a previous run
+    email_queue.start()
+
+
+@app.on_event("shutdown")
+async def close_email_connections():
+    email_queue.close()
+    close_smtp_connections()
+    await close_async_smtp_connection()
+
+
 @app.middleware("http")
 async def db_session_middleware(request, call_next):
     response = await call_next(request)
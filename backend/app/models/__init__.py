@@ -1,3 +1,3 @@
 from .core import *  # noqa: F401,F403
 from .core import TrainerRegistration, Location, Message  # noqa: F401
-from .user import User, UserRole, MailboxEmail, EmailAttachment, EmailNotification, EMAIL_FOLDERS  # noqa: F401
+from .user import User, UserRole, MailboxEmail, EmailAttachment, EmailNotification, EmailOutbox, EMAIL_FOLDERS  # noqa: F401
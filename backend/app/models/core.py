@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, date
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Enum, Float, ForeignKey, Integer, String, Table, Text, JSON
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Table, Text, JSON
 from sqlalchemy.orm import relationship
 
 from ..database import Base
@@ -231,6 +231,16 @@ class Training(Base, TimestampMixin):
     margin = Column(Float)
     checklist_template = Column(String(50), default="standard")
 
+    __table_args__ = (
+        # Matches the list ordering (start_date DESC NULLS LAST), optionally filtered by brand.
+        # SQLite does not accept NULLS LAST in index definitions, so only create it on PostgreSQL.
+        Index(
+            "ix_trainings_brand_id_start_date",
+            brand_id,
+            start_date.desc().nulls_last(),
+        ).ddl_if(dialect="postgresql"),
+    )
+
     brand = relationship("Brand", back_populates="trainings")
     customer = relationship("Customer", back_populates="trainings")
     trainer = relationship("Trainer", back_populates="trainings")
@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, and_
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from ..database import Base
@@ -37,6 +38,11 @@ class User(Base):
     # Email relationships
     mailbox_emails = relationship("MailboxEmail", back_populates="owner", foreign_keys="MailboxEmail.owner_id")
 
+    @property
+    def is_trainer(self) -> bool:
+        """Whether the user has the trainer role."""
+        return self.role == UserRole.TRAINER.value
+
     def __repr__(self):
         return f"<User {self.username} ({self.role})>"
 
@@ -45,6 +51,10 @@ class User(Base):
 EMAIL_FOLDERS = ("inbox", "sent", "drafts", "trash", "archive")
 
 
+# JSON array of email addresses; JSONB (indexable) on PostgreSQL
+AddressList = JSON().with_variant(JSONB(), "postgresql")
+
+
 class MailboxEmail(Base):
     """Email messages in user mailboxes."""
     __tablename__ = "mailbox_emails"
@@ -60,9 +70,9 @@ class MailboxEmail(Base):
     # Sender/Recipients
     from_address = Column(String(255), nullable=False)
     from_name = Column(String(255), nullable=True)
-    to_addresses = Column(Text, nullable=False)  # JSON array of addresses
-    cc_addresses = Column(Text, nullable=True)  # JSON array
-    bcc_addresses = Column(Text, nullable=True)  # JSON array
+    to_addresses = Column(AddressList, nullable=False, default=list, server_default="[]")
+    cc_addresses = Column(AddressList, nullable=False, default=list, server_default="[]")
+    bcc_addresses = Column(AddressList, nullable=False, default=list, server_default="[]")
 
     # Content
     subject = Column(String(500), nullable=True)
@@ -84,9 +94,30 @@ class MailboxEmail(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # Relationships
-    owner = relationship("User", back_populates="mailbox_emails", foreign_keys=[owner_id])
-    attachments = relationship("EmailAttachment", back_populates="email", cascade="all, delete-orphan")
+    # Relationships; never lazy-loaded, so listings can't fall into N+1 queries.
+    # Use selectinload()/joinedload() where they are needed.
+    owner = relationship("User", back_populates="mailbox_emails", foreign_keys=[owner_id], lazy="raise_on_sql")
+    attachments = relationship(
+        "EmailAttachment",
+        back_populates="email",
+        cascade="all, delete-orphan",
+        passive_deletes=True,  # deleted by the ON DELETE CASCADE foreign key
+        lazy="raise_on_sql",
+    )
+
+    __table_args__ = (
+        # Mailbox listing: WHERE owner_id, folder ORDER BY received_at DESC
+        Index("ix_mailbox_owner_folder_received", owner_id, folder, received_at.desc()),
+        # Unread inbox listing and count
+        Index(
+            "ix_mailbox_owner_unread",
+            owner_id,
+            received_at.desc(),
+            postgresql_where=and_(folder == "inbox", is_read == False),
+        ),
+        # "All emails to <address>" lookups
+        Index("ix_mailbox_to_gin", to_addresses, postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     def __repr__(self):
         return f"<MailboxEmail {self.id} - {self.subject[:30] if self.subject else 'No subject'}>"
@@ -125,3 +156,24 @@ class EmailNotification(Base):
 
     user = relationship("User")
     email = relationship("MailboxEmail")
+
+
+class EmailOutbox(Base):
+    """Outgoing emails waiting to be sent by the background worker."""
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_address = Column(String(255), nullable=False)
+    subject = Column(String(500), nullable=False)
+    body = Column(Text, nullable=False)
+
+    status = Column(String(20), nullable=False, default="pending")  # pending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_try_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_try_at", status, next_try_at),
+    )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..core.deps import get_current_active_user, get_db, require_backoffice
@@ -9,7 +8,7 @@ from ..database import SessionLocal
 from ..models import Brand, Customer, User
 from ..schemas.base import CustomerCreate, CustomerRead
 from ..services.ai import summarize_notes
-from ..utils.search import escape_like_wildcards
+from ..utils.search import contains_ignore_case
 
 router = APIRouter()
 
@@ -25,10 +24,7 @@ def list_customers(
     if brand_id:
         query = query.filter(Customer.brands.any(Brand.id == brand_id))
     if search:
-        # Escape LIKE wildcards to prevent injection
-        escaped_search = escape_like_wildcards(search.lower())
-        like = f"%{escaped_search}%"
-        query = query.filter(func.lower(Customer.company_name).like(like))
+        query = query.filter(contains_ignore_case(Customer.company_name, search))
     return query.order_by(Customer.company_name).all()
 
 
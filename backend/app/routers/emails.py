@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from sqlalchemy.orm import Session
 
 from ..config import settings
@@ -33,6 +33,45 @@ class EmailCreate(BaseModel):
     is_draft: bool = False
 
 
+class EmailSummaryResponse(BaseModel):
+    """Email in a mailbox listing, without cc and bodies."""
+    id: int
+    message_id: Optional[str]
+    thread_id: Optional[str]
+    from_address: str
+    from_name: Optional[str]
+    to_addresses: list[str]
+    subject: Optional[str]
+    folder: str
+    is_read: bool
+    is_starred: bool
+    is_draft: bool
+    direction: str
+    sent_at: Optional[str]
+    received_at: Optional[str]
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_email(cls, email: MailboxEmail) -> "EmailSummaryResponse":
+        return cls(
+            id=email.id,
+            message_id=email.message_id,
+            thread_id=email.thread_id,
+            from_address=email.from_address,
+            from_name=email.from_name,
+            to_addresses=email.to_addresses or [],
+            subject=email.subject,
+            folder=email.folder,
+            is_read=email.is_read,
+            is_starred=email.is_starred,
+            is_draft=email.is_draft,
+            direction=email.direction,
+            sent_at=email.sent_at.isoformat() if email.sent_at else None,
+            received_at=email.received_at.isoformat() if email.received_at else None,
+        )
+
+
 class EmailResponse(BaseModel):
     id: int
     message_id: Optional[str]
@@ -52,8 +91,7 @@ class EmailResponse(BaseModel):
     sent_at: Optional[str]
     received_at: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
     @classmethod
     def from_orm_email(cls, email: MailboxEmail) -> "EmailResponse":
@@ -63,8 +101,8 @@ class EmailResponse(BaseModel):
             thread_id=email.thread_id,
             from_address=email.from_address,
             from_name=email.from_name,
-            to_addresses=json.loads(email.to_addresses) if email.to_addresses else [],
-            cc_addresses=json.loads(email.cc_addresses) if email.cc_addresses else None,
+            to_addresses=email.to_addresses or [],
+            cc_addresses=email.cc_addresses or None,
             subject=email.subject,
             body_text=email.body_text,
             body_html=email.body_html,
@@ -79,9 +117,28 @@ class EmailResponse(BaseModel):
 
 
 class EmailListResponse(BaseModel):
-    emails: list[EmailResponse]
+    emails: list[EmailSummaryResponse]
     total: int
     unread: int
+    next_cursor: Optional[str] = None
+
+
+def _encode_cursor(email: MailboxEmail) -> str:
+    """Pagination cursor pointing just after the given email."""
+    return f"{email.received_at.isoformat()}_{email.id}"
+
+
+def _parse_cursor(cursor: Optional[str]) -> Optional[tuple[datetime, int]]:
+    if not cursor:
+        return None
+    try:
+        received_at, _, email_id = cursor.rpartition("_")
+        return datetime.fromisoformat(received_at), int(email_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
 
 
 class EmailStatsResponse(BaseModel):
@@ -149,7 +206,7 @@ async def get_my_platform_email(
 @router.get("/", response_model=EmailListResponse)
 async def list_emails(
     folder: str = Query("inbox", description="Email folder"),
-    skip: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
     limit: int = Query(50, ge=1, le=100),
     unread_only: bool = Query(False),
     db: Session = Depends(get_db),
@@ -163,14 +220,15 @@ async def list_emails(
         )
 
     emails = mailbox_service.get_user_emails(
-        db, current_user.id, folder, skip, limit, unread_only
+        db, current_user.id, folder, _parse_cursor(after), limit, unread_only
     )
     stats = mailbox_service.get_email_stats(db, current_user.id)
 
     return EmailListResponse(
-        emails=[EmailResponse.from_orm_email(e) for e in emails],
+        emails=[EmailSummaryResponse.from_orm_email(e) for e in emails],
         total=len(emails),
         unread=stats["unread"],
+        next_cursor=_encode_cursor(emails[-1]) if len(emails) == limit else None,
     )
 
 
@@ -238,7 +296,7 @@ async def send_email(
         )
     else:
         # Send email
-        success, email = mailbox_service.send_platform_email(
+        success, email = await mailbox_service.send_platform_email(
             db=db,
             sender_user=current_user,
             to_addresses=email_data.to_addresses,
@@ -286,8 +344,8 @@ async def reply_to_email(
     cc_addresses = None
 
     if reply_all:
-        original_to = json.loads(original_email.to_addresses) if original_email.to_addresses else []
-        original_cc = json.loads(original_email.cc_addresses) if original_email.cc_addresses else []
+        original_to = original_email.to_addresses or []
+        original_cc = original_email.cc_addresses or []
         # Add all original recipients except self
         cc_addresses = [
             addr for addr in original_to + original_cc
@@ -299,7 +357,7 @@ async def reply_to_email(
     if not subject.lower().startswith("re:"):
         subject = f"Re: {subject}"
 
-    success, email = mailbox_service.send_platform_email(
+    success, email = await mailbox_service.send_platform_email(
         db=db,
         sender_user=current_user,
         to_addresses=to_addresses,
@@ -359,7 +417,7 @@ Betreff: {original_email.subject or '(Kein Betreff)'}
 {original_email.body_text or ''}
 """
 
-    success, email = mailbox_service.send_platform_email(
+    success, email = await mailbox_service.send_platform_email(
         db=db,
         sender_user=current_user,
         to_addresses=to_addresses,
@@ -452,7 +510,7 @@ async def get_email_thread(
 # Admin endpoints for viewing all emails
 @router.get("/admin/all", response_model=list[EmailResponse])
 async def list_all_emails_admin(
-    skip: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="Cursor '<received_at>_<id>' of the last email seen"),
     limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_backoffice),
@@ -462,16 +520,16 @@ async def list_all_emails_admin(
     Excludes the viewer's own emails for privacy.
     """
     emails = mailbox_service.get_all_emails_for_admin(
-        db, skip, limit, user_id_filter=current_user.id
+        db, _parse_cursor(after), limit, user_id_filter=current_user.id
     )
     return [EmailResponse.from_orm_email(e) for e in emails]
 
 
-@router.get("/admin/user/{user_id}", response_model=list[EmailResponse])
+@router.get("/admin/user/{user_id}", response_model=list[EmailSummaryResponse])
 async def list_user_emails_admin(
     user_id: int,
     folder: Optional[str] = None,
-    skip: int = Query(0, ge=0),
+    after: Optional[str] = Query(None, description="Cursor '<received_at>_<id>' of the last email seen"),
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin),
@@ -485,6 +543,6 @@ async def list_user_emails_admin(
         )
 
     emails = mailbox_service.get_user_emails(
-        db, user_id, folder or "inbox", skip, limit
+        db, user_id, folder or "inbox", _parse_cursor(after), limit
     )
-    return [EmailResponse.from_orm_email(e) for e in emails]
+    return [EmailSummaryResponse.from_orm_email(e) for e in emails]
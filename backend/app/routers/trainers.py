@@ -2,38 +2,44 @@ from __future__ import annotations
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from ..core.deps import get_current_active_user, get_db, require_backoffice
 from ..database import SessionLocal
 from ..models import Brand, Trainer, Training, User
 from ..models.core import TrainerApplication
-from ..schemas.base import TrainerCreate, TrainerRead
-from ..utils.search import escape_like_wildcards
+from ..schemas.base import TrainerCreate, TrainerListRead, TrainerRead, TrainerUpdate
+from ..utils.search import contains_ignore_case
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[TrainerRead])
+@router.get("", response_model=list[TrainerListRead])
 def list_trainers(
     search: str | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """List all trainers."""
-    query = db.query(Trainer)
+    query = db.query(Trainer).options(
+        load_only(
+            Trainer.id,
+            Trainer.first_name,
+            Trainer.last_name,
+            Trainer.email,
+            Trainer.phone,
+            Trainer.tags,
+            Trainer.region,
+        )
+    )
     if search:
-        # Escape LIKE wildcards to prevent injection
-        escaped_search = escape_like_wildcards(search.lower())
-        like = f"%{escaped_search}%"
         query = query.filter(
-            (func.lower(Trainer.last_name).like(like))
-            | (func.lower(Trainer.first_name).like(like))
-            | (func.lower(Trainer.tags).like(like))
-            | (func.lower(Trainer.email).like(like))
+            contains_ignore_case(Trainer.last_name, search)
+            | contains_ignore_case(Trainer.first_name, search)
+            | contains_ignore_case(Trainer.tags, search)
+            | contains_ignore_case(Trainer.email, search)
         )
     return query.order_by(Trainer.last_name).all()
 
@@ -58,7 +64,6 @@ def create_trainer(
 
     db.add(trainer)
     db.commit()
-    db.refresh(trainer)
     return trainer
 
 
@@ -76,22 +81,38 @@ def get_trainer(
 
 
 @router.put("/{trainer_id}", response_model=TrainerRead)
-def update_trainer(
+def replace_trainer(
     trainer_id: int,
     payload: TrainerCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_backoffice),
 ):
-    """Update a trainer. Requires backoffice or admin role."""
+    """Update a trainer with the full payload. Requires backoffice or admin role."""
+    values = payload.model_dump(exclude={"brand_ids"})
+    return _apply_trainer_update(db, trainer_id, values, payload.brand_ids)
+
+
+@router.patch("/{trainer_id}", response_model=TrainerRead)
+def update_trainer(
+    trainer_id: int,
+    payload: TrainerUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_backoffice),
+):
+    """Update the fields sent in the payload. Requires backoffice or admin role."""
+    values = payload.model_dump(exclude_unset=True, exclude={"brand_ids"})
+    return _apply_trainer_update(db, trainer_id, values, payload.brand_ids)
+
+
+def _apply_trainer_update(db: Session, trainer_id: int, values: dict, brand_ids: list[int] | None) -> Trainer:
     trainer = db.get(Trainer, trainer_id)
     if not trainer:
         raise HTTPException(status_code=404, detail="Trainer not found")
-    for key, value in payload.dict(exclude={"brand_ids"}).items():
+    for key, value in values.items():
         setattr(trainer, key, value)
-    if payload.brand_ids:
-        trainer.brands = db.query(Brand).filter(Brand.id.in_(payload.brand_ids)).all()
+    if brand_ids:
+        trainer.brands = db.query(Brand).filter(Brand.id.in_(brand_ids)).all()
     db.commit()
-    db.refresh(trainer)
     return trainer
 
 
@@ -2,24 +2,42 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, load_only
 
 from ..core.deps import get_current_active_user, get_db, require_backoffice
 from ..database import SessionLocal
-from ..models import ActivityLog, Brand, Customer, Trainer, Training, TrainingCatalogEntry, TrainingTask, User, UserRole
-from ..schemas.base import TrainingCreate, TrainingRead
+from ..models import ActivityLog, Brand, Customer, Trainer, Training, TrainingCatalogEntry, TrainingTask, User
+from ..schemas.base import TrainingCreate, TrainingListRead, TrainingRead, TrainingUpdate
 from ..services import checklist
 
 router = APIRouter()
 
 
-def _log_activity(db: Session, training: Training, message: str, actor: str = "system"):
-    log = ActivityLog(training=training, message=message, created_by=actor)
-    db.add(log)
+def _log_activity(db: Session, training: Training, messages: str | list[str], actor: str = "system"):
+    """Insert one or more activity log entries with a single INSERT statement."""
+    if isinstance(messages, str):
+        messages = [messages]
+    if training.id is None:
+        db.flush()
+    db.execute(
+        insert(ActivityLog),
+        [{"training_id": training.id, "message": message, "created_by": actor} for message in messages],
+    )
 
 
-@router.get("", response_model=list[TrainingRead])
+def _log_activity_background(training_id: int, message: str, actor: str = "system"):
+    """Write an activity log entry after the response has been sent."""
+    db = SessionLocal()
+    try:
+        db.execute(insert(ActivityLog).values(training_id=training_id, message=message, created_by=actor))
+        db.commit()
+    finally:
+        db.close()
+
+
+@router.get("", response_model=list[TrainingListRead])
 def list_trainings(
     brand_id: int | None = Query(default=None),
     status: str | None = Query(default=None),
@@ -27,10 +45,24 @@ def list_trainings(
     current_user: User = Depends(get_current_active_user),
 ):
     """List trainings. Trainers can only see their own trainings."""
-    query = db.query(Training)
+    query = db.query(Training).options(
+        load_only(
+            Training.id,
+            Training.title,
+            Training.training_type,
+            Training.training_format,
+            Training.brand_id,
+            Training.customer_id,
+            Training.trainer_id,
+            Training.status,
+            Training.start_date,
+            Training.end_date,
+            Training.location,
+        )
+    )
 
     # Trainers can only see their own trainings
-    if UserRole(current_user.role) == UserRole.TRAINER:
+    if current_user.is_trainer:
         # Find trainer associated with this user (by email matching)
         trainer = db.query(Trainer).filter(Trainer.email == current_user.email).first()
         if trainer:
@@ -70,7 +102,6 @@ def create_training(
 
     _log_activity(db, training, f"Training angelegt von {current_user.username}", current_user.username)
     db.commit()
-    db.refresh(training)
     return training
 
 
@@ -86,7 +117,7 @@ def get_training(
         raise HTTPException(status_code=404, detail="Training not found")
 
     # Trainers can only see their own trainings
-    if UserRole(current_user.role) == UserRole.TRAINER:
+    if current_user.is_trainer:
         trainer = db.query(Trainer).filter(Trainer.email == current_user.email).first()
         if not trainer or training.trainer_id != trainer.id:
             raise HTTPException(status_code=403, detail="Access denied")
@@ -95,25 +126,48 @@ def get_training(
 
 
 @router.put("/{training_id}", response_model=TrainingRead)
-def update_training(
+def replace_training(
     training_id: int,
     payload: TrainingCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_backoffice),
 ):
-    """Update a training. Requires backoffice or admin role."""
+    """Update a training with the full payload. Requires backoffice or admin role."""
+    values = payload.model_dump(exclude={"tasks", "generate_checklist"})
+    return _apply_training_update(db, training_id, values, payload.tasks, payload.generate_checklist, current_user)
+
+
+@router.patch("/{training_id}", response_model=TrainingRead)
+def update_training(
+    training_id: int,
+    payload: TrainingUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_backoffice),
+):
+    """Update the fields sent in the payload. Requires backoffice or admin role."""
+    values = payload.model_dump(exclude_unset=True, exclude={"tasks", "generate_checklist"})
+    return _apply_training_update(db, training_id, values, payload.tasks, payload.generate_checklist, current_user)
+
+
+def _apply_training_update(
+    db: Session,
+    training_id: int,
+    values: dict,
+    tasks: list | None,
+    generate_checklist: bool,
+    current_user: User,
+) -> Training:
     training = db.get(Training, training_id)
     if not training:
         raise HTTPException(status_code=404, detail="Training not found")
-    for key, value in payload.dict(exclude={"tasks", "generate_checklist"}).items():
+    for key, value in values.items():
         setattr(training, key, value)
-    if payload.tasks:
-        training.tasks = [TrainingTask(**task.dict()) for task in payload.tasks]
-    elif payload.generate_checklist:
+    if tasks:
+        training.tasks = [TrainingTask(**task.model_dump()) for task in tasks]
+    elif generate_checklist:
         training.tasks = checklist.generate_tasks(training)
     _log_activity(db, training, f"Training aktualisiert von {current_user.username}", current_user.username)
     db.commit()
-    db.refresh(training)
     return training
 
 
@@ -121,6 +175,7 @@ def update_training(
 def update_status(
     training_id: int,
     status: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_backoffice),
 ):
@@ -129,8 +184,13 @@ def update_status(
     if not training:
         raise HTTPException(status_code=404, detail="Training not found")
     training.status = status
-    _log_activity(db, training, f"Status auf {status} gesetzt von {current_user.username}", current_user.username)
     db.commit()
+    background_tasks.add_task(
+        _log_activity_background,
+        training_id,
+        f"Status auf {status} gesetzt von {current_user.username}",
+        current_user.username,
+    )
     return {"status": status}
 
 
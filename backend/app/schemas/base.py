@@ -3,7 +3,14 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def _reject_null(value):
+    """Partial updates may leave a required field out, but not set it to null."""
+    if value is None:
+        raise ValueError("must not be null")
+    return value
 
 
 class BrandBase(BaseModel):
@@ -23,8 +30,7 @@ class BrandCreate(BrandBase):
 class BrandRead(BrandBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CustomerBase(BaseModel):
@@ -46,8 +52,7 @@ class CustomerCreate(CustomerBase):
 class CustomerRead(CustomerBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrainerBase(BaseModel):
@@ -67,11 +72,39 @@ class TrainerCreate(TrainerBase):
     pass
 
 
+class TrainerUpdate(BaseModel):
+    """Partial trainer update: only the fields sent by the client are applied."""
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    default_day_rate: Optional[float] = None
+    preferred_topics: Optional[str] = None
+    tags: Optional[str] = None
+    region: Optional[str] = None
+    notes: Optional[str] = None
+    brand_ids: Optional[List[int]] = None
+
+    _required_not_null = field_validator("first_name", "last_name", "email")(_reject_null)
+
+
 class TrainerRead(TrainerBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TrainerListRead(BaseModel):
+    """Trainer row for list views (without notes and long text fields)."""
+    id: int
+    first_name: str
+    last_name: str
+    email: str
+    phone: Optional[str] = None
+    tags: Optional[str] = None
+    region: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrainingCatalogBase(BaseModel):
@@ -91,8 +124,7 @@ class TrainingCatalogCreate(TrainingCatalogBase):
 class TrainingCatalogRead(TrainingCatalogBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrainingTaskBase(BaseModel):
@@ -112,8 +144,7 @@ class TrainingTaskCreate(TrainingTaskBase):
 class TrainingTaskRead(TrainingTaskBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TrainingBase(BaseModel):
@@ -159,12 +190,82 @@ class TrainingCreate(TrainingBase):
     generate_checklist: bool = True
 
 
+class TrainingUpdate(BaseModel):
+    """Partial training update: only the fields sent by the client are applied."""
+    title: Optional[str] = None
+    training_type: Optional[str] = None
+    training_format: Optional[str] = None
+    duration_days: Optional[int] = None
+    brand_id: Optional[int] = None
+    customer_id: Optional[int] = None
+    trainer_id: Optional[int] = None
+    status: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    timezone: Optional[str] = None
+    location: Optional[str] = None
+    location_details: Optional[str] = None
+    online_link: Optional[str] = None
+    max_participants: Optional[int] = None
+    language: Optional[str] = None
+    is_recurring: Optional[bool] = None
+    recurrence_pattern: Optional[str] = None
+    contact_person: Optional[str] = None
+    billing_details: Optional[str] = None
+    internal_customer_reference: Optional[str] = None
+    logistics_notes: Optional[str] = None
+    communication_notes: Optional[str] = None
+    finance_notes: Optional[str] = None
+    internal_notes: Optional[str] = None
+    internal_priority: Optional[str] = None
+    pipeline_status: Optional[str] = None
+    tagessatz: Optional[float] = None
+    travel_rules: Optional[str] = None
+    payment_terms: Optional[str] = None
+    lexoffice_id: Optional[str] = None
+    price_external: Optional[float] = None
+    price_internal: Optional[float] = None
+    margin: Optional[float] = None
+    checklist_template: Optional[str] = None
+    tasks: Optional[List[TrainingTaskCreate]] = None
+    generate_checklist: bool = False
+
+    _required_not_null = field_validator(
+        "title",
+        "training_type",
+        "training_format",
+        "duration_days",
+        "brand_id",
+        "customer_id",
+        "status",
+        "language",
+        "is_recurring",
+        "checklist_template",
+    )(_reject_null)
+
+
 class TrainingRead(TrainingBase):
     id: int
     tasks: List[TrainingTaskRead] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TrainingListRead(BaseModel):
+    """Training row for list views (without notes, billing details and tasks)."""
+    id: int
+    title: str
+    training_type: Optional[str] = None
+    training_format: Optional[str] = None
+    brand_id: int
+    customer_id: int
+    trainer_id: Optional[int] = None
+    status: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    location: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ActivityLogRead(BaseModel):
@@ -173,8 +274,7 @@ class ActivityLogRead(BaseModel):
     created_at: datetime
     created_by: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class EmailTemplateBase(BaseModel):
@@ -192,8 +292,7 @@ class EmailTemplateCreate(EmailTemplateBase):
 class EmailTemplateRead(EmailTemplateBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SearchResponse(BaseModel):
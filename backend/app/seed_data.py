@@ -37,12 +37,11 @@ SEED_CATALOG = [
 
 def seed():
     Base.metadata.create_all(bind=engine)
-    session = SessionLocal()
-    try:
+    # One transaction for the whole seed: a single COMMIT at the end of the block
+    with SessionLocal.begin() as session:
         if session.query(Brand).count() == 0:
             brands = [Brand(**data) for data in SEED_BRANDS]
             session.add_all(brands)
-            session.flush()
         else:
             brands = session.query(Brand).all()
 
@@ -69,9 +68,9 @@ def seed():
         if session.query(TrainingCatalogEntry).count() == 0:
             session.add_all(TrainingCatalogEntry(**data) for data in SEED_CATALOG)
 
-        session.commit()
-
         if session.query(Training).count() == 0 and customers and brands and trainers:
+            # The training references the IDs of the rows added above
+            session.flush()
             training = Training(
                 title="Pilot Copilot-Training",
                 training_type="online",
@@ -87,9 +86,6 @@ def seed():
             )
             training.tasks = checklist.generate_tasks(training)
             session.add(training)
-            session.commit()
-    finally:
-        session.close()
 
 
 if __name__ == "__main__":
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import logging
+import re
 import secrets
 import string
-import requests
-from typing import Optional, Tuple
+import threading
+from typing import Iterable, Optional, Tuple
+
+import httpx
 
 from ..config import settings
 
@@ -14,11 +17,30 @@ logger = logging.getLogger(__name__)
 # AlwaysData API configuration
 ALWAYSDATA_API_URL = "https://api.alwaysdata.com/v1"
 
+PASSWORD_ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*"
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(PASSWORD_ALPHABET)
+
+# Translation of umlauts and spaces for mailbox names (mueller, von-der-heide)
+_EMAIL_NAME_TRANSLATION = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', ' ': '-'})
+_EMAIL_NAME_INVALID_CHARS = re.compile(r'[^a-z0-9-]')
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
 
 def generate_secure_password(length: int = 16) -> str:
     """Generate a secure random password."""
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # Draw all random bytes at once instead of one CSPRNG call per character.
+    # Bytes above the largest multiple of the alphabet size are discarded to
+    # keep the character distribution uniform.
+    chars: list[str] = []
+    while len(chars) < length:
+        chars.extend(
+            PASSWORD_ALPHABET[b % len(PASSWORD_ALPHABET)]
+            for b in secrets.token_bytes(length)
+            if b < _PASSWORD_BYTE_LIMIT
+        )
+    return ''.join(chars[:length])
 
 
 def get_api_auth() -> Tuple[str, str]:
@@ -29,6 +51,26 @@ def get_api_auth() -> Tuple[str, str]:
     return (f"{api_key} account={account}", "")
 
 
+def get_client() -> httpx.Client:
+    """
+    Get the shared AlwaysData API client.
+
+    The client is created lazily and keeps its connection pool alive, so
+    consecutive API calls reuse the same TLS connection. The lock makes sure
+    concurrent first requests don't each build (and leak) a client.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    base_url=ALWAYSDATA_API_URL,
+                    auth=get_api_auth(),
+                    timeout=30,
+                )
+    return _client
+
+
 def create_mailbox(
     email_name: str,
     domain_id: int,
@@ -62,12 +104,7 @@ def create_mailbox(
         }
         logger.debug(f"AlwaysData API request payload: {payload}")
 
-        response = requests.post(
-            f"{ALWAYSDATA_API_URL}/mailbox/",
-            auth=get_api_auth(),
-            json=payload,
-            timeout=30
-        )
+        response = get_client().post("/mailbox/", json=payload)
 
         logger.info(f"AlwaysData API response: status={response.status_code}")
 
@@ -91,11 +128,7 @@ def delete_mailbox(mailbox_id: int) -> bool:
         return False
 
     try:
-        response = requests.delete(
-            f"{ALWAYSDATA_API_URL}/mailbox/{mailbox_id}/",
-            auth=get_api_auth(),
-            timeout=30
-        )
+        response = get_client().delete(f"/mailbox/{mailbox_id}/")
         return response.status_code in (200, 204)
     except Exception as e:
         logger.error(f"Error deleting mailbox: {e}")
@@ -108,11 +141,7 @@ def list_mailboxes() -> list:
         return []
 
     try:
-        response = requests.get(
-            f"{ALWAYSDATA_API_URL}/mailbox/",
-            auth=get_api_auth(),
-            timeout=30
-        )
+        response = get_client().get("/mailbox/")
         if response.status_code == 200:
             return response.json()
         return []
@@ -127,12 +156,7 @@ def get_domain_id(domain_name: str) -> Optional[int]:
         return None
 
     try:
-        response = requests.get(
-            f"{ALWAYSDATA_API_URL}/domain/",
-            auth=get_api_auth(),
-            params={"name": domain_name},
-            timeout=30
-        )
+        response = get_client().get("/domain/", params={"name": domain_name})
         if response.status_code == 200:
             domains = response.json()
             for domain in domains:
@@ -144,14 +168,14 @@ def get_domain_id(domain_name: str) -> Optional[int]:
         return None
 
 
-def create_user_mailbox(last_name: str, existing_emails: list[str] = None) -> Tuple[bool, Optional[str], Optional[str]]:
+def create_user_mailbox(last_name: str, existing_emails: Iterable[str] = None) -> Tuple[bool, Optional[str], Optional[str]]:
     """
     Create a mailbox for a user based on their last name.
     Handles duplicates by adding incrementing numbers.
 
     Args:
         last_name: User's last name
-        existing_emails: List of existing platform emails to check for duplicates
+        existing_emails: Existing platform emails to check for duplicates
 
     Returns:
         Tuple of (success, email_address, password)
@@ -161,20 +185,21 @@ def create_user_mailbox(last_name: str, existing_emails: list[str] = None) -> Tu
         return False, None, None
 
     # Normalize last name for email
-    email_name = last_name.lower().replace(' ', '-').replace('ä', 'ae').replace('ö', 'oe').replace('ü', 'ue').replace('ß', 'ss')
+    email_name = last_name.lower().translate(_EMAIL_NAME_TRANSLATION)
 
     # Remove special characters
-    email_name = ''.join(c for c in email_name if c.isalnum() or c == '-')
+    email_name = _EMAIL_NAME_INVALID_CHARS.sub('', email_name)
 
     if not email_name:
         email_name = "user"
 
     # Check for duplicates and add number if needed
     if existing_emails:
+        existing = set(existing_emails)
         base_email = f"{email_name}@{settings.platform_email_domain}"
-        if base_email in existing_emails:
+        if base_email in existing:
             counter = 1
-            while f"{email_name}{counter}@{settings.platform_email_domain}" in existing_emails:
+            while f"{email_name}{counter}@{settings.platform_email_domain}" in existing:
                 counter += 1
             email_name = f"{email_name}{counter}"
 
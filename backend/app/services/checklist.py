@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Iterable, List
 
 from ..models import Training, TrainingTask
@@ -18,23 +20,28 @@ CLASSROOM_DEFAULT_TASKS = (
 )
 
 
-def _base_tasks_for_training(training: Training) -> Iterable[str]:
-    if training.training_type == "online":
-        return ONLINE_DEFAULT_TASKS
-    return CLASSROOM_DEFAULT_TASKS
+DEFAULT_TASKS_BY_TYPE = MappingProxyType({
+    "online": ONLINE_DEFAULT_TASKS,
+    "classroom": CLASSROOM_DEFAULT_TASKS,
+})
+
+
+def _base_tasks_for_type(training_type: str | None) -> Iterable[str]:
+    return DEFAULT_TASKS_BY_TYPE.get(training_type, CLASSROOM_DEFAULT_TASKS)
+
+
+@lru_cache(maxsize=64)
+def _task_template(training_type: str | None) -> tuple[dict, ...]:
+    """Expand the default tasks for a training type once and reuse the result."""
+    return tuple(
+        {"title": title, "is_required": True, "status": "open", "assignee": "Backoffice"}
+        for title in _base_tasks_for_type(training_type)
+    )
 
 
 def generate_tasks(training: Training, due_date: date | None = None) -> List[TrainingTask]:
-    base_tasks = list(_base_tasks_for_training(training))
-    tasks: List[TrainingTask] = []
-    for title in base_tasks:
-        tasks.append(
-            TrainingTask(
-                title=title,
-                is_required=True,
-                status="open",
-                due_date=due_date or (training.start_date - timedelta(days=7) if training.start_date else None),
-                assignee="Backoffice",
-            )
-        )
-    return tasks
+    resolved_due_date = due_date or (training.start_date - timedelta(days=7) if training.start_date else None)
+    return [
+        TrainingTask(**task_data, due_date=resolved_due_date)
+        for task_data in _task_template(training.training_type)
+    ]
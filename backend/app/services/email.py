@@ -1,16 +1,221 @@
 """Email service for sending notifications."""
 from __future__ import annotations
 
+import asyncio
+import atexit
 import logging
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from email.message import EmailMessage
+from types import MappingProxyType
+from typing import Iterable, Optional
+
+import aiosmtplib
+from jinja2 import DictLoader, Environment
+from sqlalchemy import select
 
 from ..config import settings
+from ..database import SessionLocal
+from ..models import EmailOutbox
+from ..utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
+SMTP_TIMEOUT = 30
+
+# A bulk send of at least BULK_ABORT_MIN_BATCH emails is abandoned once a
+# third of it has failed - the server is refusing us, not the recipients
+BULK_ABORT_MIN_BATCH = 30
+
+# Settings are read once at startup and never change at runtime
+_EMAIL_ENABLED = settings.email_enabled
+_FROM_HEADER = f"{settings.smtp_from_name} <{settings.smtp_from_email}>"
+
+
+@dataclass(slots=True)
+class OutgoingEmail:
+    """A plain text email waiting to be sent."""
+
+    to: str
+    subject: str
+    body: str
+    sent: bool = False
+
+
+class SMTPBulkAborted(Exception):
+    """Raised when a bulk send is abandoned because too many emails failed."""
+
+    def __init__(self, sent: int, failed: int, unsent: list[OutgoingEmail]):
+        super().__init__(f"Bulk send aborted after {failed} failures ({sent} sent, {len(unsent)} unsent)")
+        self.sent = sent
+        self.failed = failed
+        self.unsent = unsent
+
+
+class SMTPConnection:
+    """
+    Long-lived SMTP session that is reused across sends.
+
+    The connection is opened lazily and checked with NOOP before each use;
+    if the server has dropped it, a new session is opened and logged in.
+    After max_per_connection messages the session is recycled, since
+    providers start throttling long-lived connections. Connection attempts
+    go through a circuit breaker, so an unreachable server is not retried
+    for every single email.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        use_tls: bool,
+        username: str,
+        password: str,
+        max_per_connection: int = 4500,
+    ):
+        self.host = host
+        self.port = port
+        self.use_tls = use_tls
+        self.username = username
+        self.password = password
+        self.max_per_connection = max_per_connection
+        self.sent_count = 0
+        self.breaker = CircuitBreaker(f"SMTP {host}")
+        self._server: Optional[smtplib.SMTP] = None
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.use_tls:
+            server = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT)
+            server.starttls()
+        else:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=SMTP_TIMEOUT)
+
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        return server
+
+    def ensure_connected(self) -> smtplib.SMTP:
+        """Return a live SMTP session, reconnecting if necessary."""
+        if self._server is not None and self.sent_count >= self.max_per_connection:
+            logger.info(f"SMTP connection to {self.host} sent {self.sent_count} emails - reconnecting")
+            self.close()
+
+        if self._server is not None:
+            try:
+                self._server.noop()
+                return self._server
+            except (smtplib.SMTPServerDisconnected, OSError):
+                logger.info(f"SMTP connection to {self.host} lost - reconnecting")
+                self._server = None
+
+        self.breaker.before_call()
+        try:
+            self._server = self._connect()
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        self.sent_count = 0
+        return self._server
+
+    def send_message(self, msg: EmailMessage) -> None:
+        self.ensure_connected().send_message(msg)
+        self.sent_count += 1
+
+    def close(self) -> None:
+        """Quit the SMTP session if one is open."""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            self._server = None
+
+
+# One SMTP connection per thread and server configuration
+_local = threading.local()
+_all_connections: list[SMTPConnection] = []
+_all_connections_lock = threading.Lock()
+
+
+def get_smtp_connection() -> SMTPConnection:
+    """Get the calling thread's SMTP connection for the configured server."""
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    key = (settings.smtp_host, settings.smtp_port, settings.smtp_use_tls, settings.smtp_username)
+    connection = connections.get(key)
+    if connection is None:
+        connection = SMTPConnection(
+            settings.smtp_host,
+            settings.smtp_port,
+            settings.smtp_use_tls,
+            settings.smtp_username,
+            settings.smtp_password,
+            settings.smtp_max_emails_per_connection,
+        )
+        connections[key] = connection
+        with _all_connections_lock:
+            _all_connections.append(connection)
+    return connection
+
+
+def close_smtp_connections() -> None:
+    """Close all pooled SMTP connections (called on shutdown)."""
+    with _all_connections_lock:
+        connections = list(_all_connections)
+    for connection in connections:
+        connection.close()
+
+
+atexit.register(close_smtp_connections)
+
+
+def _email_sendable(to_email: str, subject: str) -> bool:
+    """Check that sending is enabled and SMTP is configured."""
+    if not _EMAIL_ENABLED:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Email disabled - would send to %s: %s", to_email, subject)
+        return False
+
+    if not settings.smtp_host or not settings.smtp_from_email:
+        logger.warning("SMTP not configured - email not sent")
+        return False
+
+    return True
+
+
+def _build_message(to_email: str, subject: str, body: str) -> EmailMessage:
+    msg = EmailMessage()
+    msg['From'] = _FROM_HEADER
+    msg['To'] = to_email
+    msg['Subject'] = subject
+    msg.set_content(body, subtype='plain', charset='utf-8')
+    return msg
+
+
+def _deliver(connection: SMTPConnection, to_email: str, subject: str, body: str) -> bool:
+    """Send one message over the given connection."""
+    try:
+        connection.send_message(_build_message(to_email, subject, body))
+        logger.info(f"Email sent successfully to {to_email}: {subject}")
+        return True
+
+    except CircuitOpenError:
+        raise
+
+    except Exception as e:
+        # Drop the session so the next send starts from a clean connection
+        connection.close()
+        logger.error(f"Failed to send email to {to_email}: {e}")
+        return False
+
 
 def send_email(to_email: str, subject: str, body: str) -> bool:
     """
@@ -24,48 +229,322 @@ def send_email(to_email: str, subject: str, body: str) -> bool:
     Returns:
         True if email was sent successfully, False otherwise
     """
-    if not settings.email_enabled:
-        logger.info(f"Email disabled - would send to {to_email}: {subject}")
+    if not _email_sendable(to_email, subject):
         return False
 
-    if not settings.smtp_host or not settings.smtp_from_email:
-        logger.warning("SMTP not configured - email not sent")
+    try:
+        return _deliver(get_smtp_connection(), to_email, subject, body)
+    except CircuitOpenError as e:
+        logger.warning(f"Email to {to_email} not sent: {e}")
         return False
 
-    try:
-        msg = MIMEMultipart()
-        msg['From'] = f"{settings.smtp_from_name} <{settings.smtp_from_email}>"
-        msg['To'] = to_email
-        msg['Subject'] = subject
 
-        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+def send_emails_bulk(messages: Iterable[OutgoingEmail]) -> int:
+    """
+    Send several plain text emails over one SMTP connection.
 
-        if settings.smtp_use_tls:
-            server = smtplib.SMTP(settings.smtp_host, settings.smtp_port)
-            server.starttls()
-        else:
-            server = smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port)
+    Args:
+        messages: Emails to send
 
-        if settings.smtp_username and settings.smtp_password:
-            server.login(settings.smtp_username, settings.smtp_password)
+    Returns:
+        Number of emails sent successfully
 
-        server.sendmail(settings.smtp_from_email, to_email, msg.as_string())
-        server.quit()
+    Raises:
+        SMTPBulkAborted: if the batch has at least BULK_ABORT_MIN_BATCH emails
+            and a third of them failed, or if the SMTP circuit breaker is open
+            (then __cause__ is the CircuitOpenError); the remaining emails
+            are not attempted
+    """
+    messages = list(messages)
+    batch_size = len(messages)
+    connection = get_smtp_connection()
+    sent = 0
+    fail_count = 0
+    for index, message in enumerate(messages):
+        if not _email_sendable(message.to, message.subject):
+            continue
+        try:
+            delivered = _deliver(connection, message.to, message.subject, message.body)
+        except CircuitOpenError as e:
+            raise SMTPBulkAborted(sent, fail_count, messages[index:]) from e
+        if delivered:
+            message.sent = True
+            sent += 1
+            continue
+        fail_count += 1
+        if batch_size >= BULK_ABORT_MIN_BATCH and fail_count * 3 >= batch_size:
+            raise SMTPBulkAborted(sent, fail_count, messages[index + 1:])
+    return sent
+
+
+class EmailQueue:
+    """
+    Background worker that sends the emails stored in the EmailOutbox table.
+
+    queue_email() only inserts a pending row and wakes the worker, so queued
+    emails survive a restart. The worker claims up to target_batch_size due
+    rows with SELECT ... FOR UPDATE SKIP LOCKED, so several app processes can
+    drain the same outbox without sending an email twice. Each batch goes out
+    over one pooled SMTP connection and its rows are updated in the same
+    transaction.
+
+    A failed email is retried with exponential backoff and marked failed after
+    max_attempts. While the SMTP circuit breaker is open the worker backs off
+    as well and the remaining rows stay pending.
+    """
 
-        logger.info(f"Email sent successfully to {to_email}: {subject}")
-        return True
+    def __init__(
+        self,
+        target_batch_size: int = 50,
+        poll_interval: float = 5.0,
+        max_attempts: int = 5,
+        base_retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ):
+        self.target_batch_size = target_batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_retry_delay = base_retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._retry_delay = base_retry_delay
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closing = threading.Event()
+
+    def start(self) -> None:
+        """Start the worker thread if sending is enabled and it isn't running."""
+        # Started lazily so that every (forked) worker process gets its own thread
+        if not _EMAIL_ENABLED or self._closing.is_set():
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="email-queue", daemon=True)
+                self._thread.start()
+
+    def put(self, message: OutgoingEmail) -> None:
+        """Store one email in the outbox and wake the worker."""
+        with SessionLocal.begin() as session:
+            session.add(EmailOutbox(to_address=message.to, subject=message.subject, body=message.body))
+        self.start()
+        self._wakeup.set()
+
+    def process_pending(self) -> int:
+        """
+        Send one batch of due outbox emails.
+
+        Returns:
+            Number of rows claimed; 0 if nothing was due or SMTP is unavailable
+        """
+        with SessionLocal.begin() as session:
+            rows = session.scalars(
+                select(EmailOutbox)
+                .where(EmailOutbox.status == "pending", EmailOutbox.next_try_at <= datetime.utcnow())
+                .order_by(EmailOutbox.id)
+                .limit(self.target_batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not rows:
+                return 0
+
+            messages = [OutgoingEmail(row.to_address, row.subject, row.body) for row in rows]
+            unsent: list[OutgoingEmail] = []
+            try:
+                send_emails_bulk(messages)
+            except SMTPBulkAborted as e:
+                logger.warning(f"Email batch aborted, {len(e.unsent)} emails stay queued: {e}")
+                unsent = e.unsent
+
+            unsent_ids = {id(message) for message in unsent}
+            now = datetime.utcnow()
+            for row, message in zip(rows, messages):
+                if message.sent:
+                    row.status = "sent"
+                    row.sent_at = now
+                elif id(message) not in unsent_ids:
+                    row.attempts += 1
+                    if row.attempts >= self.max_attempts:
+                        row.status = "failed"
+                        logger.error(f"Giving up on email to {row.to_address} after {row.attempts} attempts")
+                    else:
+                        delay = min(self.base_retry_delay * 2 ** row.attempts, self.max_retry_delay)
+                        row.next_try_at = now + timedelta(seconds=delay)
+
+        if unsent:
+            return 0
+        return len(rows)
+
+    def _run(self) -> None:
+        while not self._closing.is_set():
+            try:
+                claimed = self.process_pending()
+            except Exception as e:
+                logger.error(f"Failed to process email outbox: {e}")
+                claimed = 0
+
+            if claimed:
+                self._retry_delay = self.base_retry_delay
+                if claimed == self.target_batch_size:
+                    continue
+                delay = self.poll_interval
+            elif self._is_backing_off():
+                delay = self._retry_delay
+                self._retry_delay = min(self._retry_delay * 2, self.max_retry_delay)
+            else:
+                delay = self.poll_interval
+
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+    def _is_backing_off(self) -> bool:
+        return get_smtp_connection().breaker.state != CircuitBreaker.CLOSED
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop the worker thread; unsent emails stay in the outbox."""
+        self._closing.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout)
+
+
+email_queue = EmailQueue()
+# Registered after close_smtp_connections, so it runs first at exit
+atexit.register(email_queue.close)
+
+
+def queue_email(to_email: str, subject: str, body: str) -> bool:
+    """
+    Store a plain text email in the outbox for the background worker.
 
-    except Exception as e:
-        logger.error(f"Failed to send email to {to_email}: {e}")
+    Returns:
+        True if the email was queued, False if sending is disabled or not configured
+    """
+    if not _email_sendable(to_email, subject):
         return False
 
+    email_queue.put(OutgoingEmail(to_email, subject, body))
+    return True
+
+
+# One long-lived async SMTP session for the event loop; SMTP is sequential
+# per connection, so sends are serialised by the lock
+_async_smtp: Optional[aiosmtplib.SMTP] = None
+_async_smtp_lock: Optional[asyncio.Lock] = None
+
+
+async def _ensure_async_connected() -> aiosmtplib.SMTP:
+    global _async_smtp
+
+    if _async_smtp is not None and _async_smtp.is_connected:
+        try:
+            await _async_smtp.noop()
+            return _async_smtp
+        except (aiosmtplib.SMTPException, OSError):
+            logger.info(f"SMTP connection to {settings.smtp_host} lost - reconnecting")
+            _async_smtp.close()
+            _async_smtp = None
+
+    # smtp_use_tls means STARTTLS on the submission port, otherwise implicit TLS
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.smtp_host,
+        port=settings.smtp_port,
+        use_tls=not settings.smtp_use_tls,
+        start_tls=settings.smtp_use_tls,
+        timeout=SMTP_TIMEOUT,
+    )
+    await smtp.connect()
+    if settings.smtp_username and settings.smtp_password:
+        await smtp.login(settings.smtp_username, settings.smtp_password)
+    _async_smtp = smtp
+    return smtp
+
+
+async def send_email_async(to_email: str, subject: str, body: str) -> bool:
+    """
+    Send a plain text email without blocking the event loop.
+
+    For use in async route handlers; send_email stays for sync callers.
+
+    Returns:
+        True if email was sent successfully, False otherwise
+    """
+    return await send_emails_async([to_email], subject, body) == 1
+
+
+async def send_emails_async(to_emails: list[str], subject: str, body: str) -> int:
+    """
+    Send the same plain text email to several recipients without blocking the event loop.
+
+    Every recipient gets a message of their own, see send_emails_bulk_async.
+
+    Returns:
+        Number of emails sent successfully
+    """
+    return await send_emails_bulk_async([OutgoingEmail(to_email, subject, body) for to_email in to_emails])
+
+
+async def send_emails_bulk_async(messages: Iterable[OutgoingEmail]) -> int:
+    """
+    Send several plain text emails without blocking the event loop.
+
+    The whole batch goes out over one SMTP session (checked once, not per
+    email). Sets `sent` on every message that was delivered.
+
+    Returns:
+        Number of emails sent successfully
+    """
+    global _async_smtp, _async_smtp_lock
+
+    messages = [message for message in messages if _email_sendable(message.to, message.subject)]
+    if not messages:
+        return 0
+
+    if _async_smtp_lock is None:
+        _async_smtp_lock = asyncio.Lock()
+
+    sent = 0
+    async with _async_smtp_lock:
+        smtp = None
+        for message in messages:
+            try:
+                if smtp is None:
+                    smtp = await _ensure_async_connected()
+                await smtp.send_message(_build_message(message.to, message.subject, message.body))
+                logger.info(f"Email sent successfully to {message.to}: {message.subject}")
+                message.sent = True
+                sent += 1
+
+            except Exception as e:
+                # Drop the session so the next send starts from a clean connection
+                if _async_smtp is not None:
+                    _async_smtp.close()
+                    _async_smtp = None
+                smtp = None
+                logger.error(f"Failed to send email to {message.to}: {e}")
+    return sent
+
+
+async def close_async_smtp_connection() -> None:
+    """Quit the async SMTP session if one is open (called on shutdown)."""
+    global _async_smtp
+
+    if _async_smtp is None:
+        return
+    try:
+        await _async_smtp.quit()
+    except (aiosmtplib.SMTPException, OSError):
+        pass
+    finally:
+        _async_smtp = None
+
 
 # ============== Email Templates ==============
 
-def send_welcome_email(user_email: str, username: str) -> bool:
-    """Send welcome email to newly registered user."""
-    subject = "Willkommen bei Yellow-Boat Academy"
-    body = f"""Hallo {username},
+# Plain text bodies, compiled once at import time
+EMAIL_TEMPLATES = {
+    "welcome": """Hallo {{ username }},
 
 willkommen bei Yellow-Boat Academy!
 
@@ -75,14 +554,8 @@ Bei Fragen stehen wir dir gerne zur Verfuegung.
 
 Viele Gruesse,
 Das Yellow-Boat Academy Team
-"""
-    return send_email(user_email, subject, body)
-
-
-def send_trainer_welcome_email(trainer_email: str, trainer_name: str) -> bool:
-    """Send welcome email from Martin to newly registered trainer."""
-    subject = "Herzlich Willkommen bei Yellow-Boat Academy!"
-    body = f"""Hallo {trainer_name},
+""",
+    "trainer_welcome": """Hallo {{ trainer_name }},
 
 herzlich willkommen bei Yellow-Boat Academy! Wir freuen uns sehr, dich als Trainer in unserem Team begruessen zu duerfen.
 
@@ -101,14 +574,8 @@ Ich freue mich auf eine tolle Zusammenarbeit!
 Herzliche Gruesse,
 Martin
 Yellow-Boat Academy
-"""
-    return send_email(trainer_email, subject, body)
-
-
-def send_trainer_application_received(trainer_email: str, trainer_name: str) -> bool:
-    """Send confirmation email when trainer application is received."""
-    subject = "Deine Bewerbung ist eingegangen"
-    body = f"""Hallo {trainer_name},
+""",
+    "trainer_application_received": """Hallo {{ trainer_name }},
 
 vielen Dank fuer deine Bewerbung als Trainer bei Yellow-Boat Academy!
 
@@ -119,14 +586,8 @@ Bei Fragen stehen wir dir gerne zur Verfuegung.
 
 Viele Gruesse,
 Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
-
-
-def send_trainer_application_accepted(trainer_email: str, trainer_name: str) -> bool:
-    """Send email when trainer application is accepted."""
-    subject = "Deine Bewerbung wurde angenommen"
-    body = f"""Hallo {trainer_name},
+""",
+    "trainer_application_accepted": """Hallo {{ trainer_name }},
 
 herzlichen Glueckwunsch! Deine Bewerbung als Trainer bei Yellow-Boat Academy wurde angenommen.
 
@@ -136,31 +597,198 @@ Wir freuen uns auf die Zusammenarbeit!
 
 Viele Gruesse,
 Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
+""",
+    "trainer_application_rejected": """Hallo {{ trainer_name }},
 
+vielen Dank fuer dein Interesse an Yellow-Boat Academy.
 
-def send_trainer_application_rejected(trainer_email: str, trainer_name: str, reason: Optional[str] = None) -> bool:
-    """Send email when trainer application is rejected."""
-    subject = "Rueckmeldung zu deiner Bewerbung"
+Nach sorgfaeltiger Pruefung deiner Bewerbung muessen wir dir leider mitteilen,
+dass wir dir derzeit keine Trainer-Position anbieten koennen.{% if reason %}
 
-    reason_text = ""
-    if reason:
-        reason_text = f"\n\nBegruendung: {reason}\n"
+Begruendung: {{ reason }}
+{% endif %}
 
-    body = f"""Hallo {trainer_name},
+Wir wuenschen dir fuer deinen weiteren Weg alles Gute.
 
-vielen Dank fuer dein Interesse an Yellow-Boat Academy.
+Viele Gruesse,
+Das Yellow-Boat Academy Team
+""",
+    # Greeting is added per recipient by send_training_status_update
+    "training_status_update": """der Status des Trainings "{{ training_title }}" (ID: {{ training_id }}) wurde aktualisiert:
 
-Nach sorgfaeltiger Pruefung deiner Bewerbung muessen wir dir leider mitteilen,
-dass wir dir derzeit keine Trainer-Position anbieten koennen.{reason_text}
+Alter Status: {{ old_status_name }}
+Neuer Status: {{ new_status_name }}
 
-Wir wuenschen dir fuer deinen weiteren Weg alles Gute.
+Du kannst die Details im Backoffice einsehen.
+
+Viele Gruesse,
+Das Yellow-Boat Academy Team
+""",
+    "new_application_admin_notification": """Hallo,
+
+eine neue Trainer-Bewerbung ist eingegangen:
+
+Name: {{ trainer_name }}
+E-Mail: {{ trainer_email }}
+Bewerbungs-ID: {{ application_id }}
+
+Bitte pruefe die Bewerbung im Admin-Bereich des Backoffice.
+
+Viele Gruesse,
+Yellow-Boat Academy System
+""",
+    "trainer_assigned": """Hallo {{ trainer_name }},
+
+du wurdest einem neuen Training zugewiesen:
+
+Training: {{ training_title }}
+Datum: {{ training_date }}
+Kunde: {{ customer_name }}
+
+Bitte pruefe die Details im Backoffice und bestatige deine Verfuegbarkeit.
+
+Viele Gruesse,
+Das Yellow-Boat Academy Team
+""",
+    "training_reminder": """Hallo {{ trainer_name }},
+
+dies ist eine Erinnerung an dein Training morgen:
+
+Training: {{ training_title }}
+Datum: {{ training_date }}
+Uhrzeit: {{ training_time }}
+Ort: {{ location }}
+Kunde: {{ customer_name }}
+
+Bitte stelle sicher, dass du alle notwendigen Materialien vorbereitet hast.
+
+Bei Fragen oder Problemen kontaktiere uns bitte umgehend.
+
+Viele Gruesse,
+Das Yellow-Boat Academy Team
+""",
+    "training_application_submitted": """Hallo {{ trainer_name }},
+
+deine Bewerbung fuer das Training "{{ training_title }}" (ID: {{ training_id }}) wurde erfolgreich eingereicht.
+
+Wir werden deine Bewerbung pruefen und dich ueber unsere Entscheidung informieren.
+
+Du kannst den Status deiner Bewerbung jederzeit im Backoffice einsehen.
+
+Viele Gruesse,
+Das Yellow-Boat Academy Team
+""",
+    "training_application_accepted": """Hallo {{ trainer_name }},
+
+herzlichen Glueckwunsch! Deine Bewerbung fuer das Training "{{ training_title }}" wurde angenommen.
+
+Du wurdest diesem Training zugewiesen.{% if training_date or customer_name %}
+
+Training-Details:
+{% if training_date %}Datum: {{ training_date }}
+{% endif %}{% if customer_name %}Kunde: {{ customer_name }}
+{% endif %}{% endif %}
+
+Bitte pruefe die vollstaendigen Details im Backoffice und bestatige deine Verfuegbarkeit.
+
+Wir freuen uns auf die Zusammenarbeit!
 
 Viele Gruesse,
 Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
+""",
+    "training_application_rejected": """Hallo {{ trainer_name }},
+
+vielen Dank fuer dein Interesse an dem Training "{{ training_title }}".
+
+Leider koennen wir dir dieses Training derzeit nicht zuweisen.{% if reason %}
+
+Begruendung: {{ reason }}
+{% endif %}
+
+Es gibt regelmaessig neue Trainingsanfragen. Schau gerne im Backoffice nach weiteren Moeglichkeiten.
+
+Viele Gruesse,
+Das Yellow-Boat Academy Team
+""",
+    "training_application_admin_notification": """Hallo,
+
+ein Trainer hat sich fuer ein Training beworben:
+
+Trainer: {{ trainer_name }}
+Training: {{ training_title }}
+Training-ID: {{ training_id }}
+Bewerbungs-ID: {{ application_id }}
+
+Bitte pruefe die Bewerbung im Admin-Bereich des Backoffice.
+
+Viele Gruesse,
+Yellow-Boat Academy System
+""",
+}
+
+_template_env = Environment(
+    loader=DictLoader(EMAIL_TEMPLATES),
+    autoescape=False,
+    keep_trailing_newline=True,
+    auto_reload=False,
+    cache_size=-1,
+)
+# Compile every template now so rendering never has to parse one
+_compiled_templates = {name: _template_env.get_template(name) for name in EMAIL_TEMPLATES}
+
+
+# German display names for training statuses
+STATUS_NAMES_DE = MappingProxyType({
+    "lead": "Lead",
+    "appointment_scheduled": "Termin vereinbart",
+    "initial_contact": "Erstkontakt",
+    "proposal_sent": "Angebot gesendet",
+    "trainer_outreach": "Trainer-Anfrage",
+    "trainer_confirmed": "Trainer bestaetigt",
+    "planning": "In Planung",
+    "delivered": "Durchgefuehrt",
+    "invoiced": "Abgerechnet",
+})
+
+
+def render_email_body(template_name: str, **context) -> str:
+    """Render one of the precompiled plain text email templates."""
+    return _compiled_templates[template_name].render(**context)
+
+
+def send_welcome_email(user_email: str, username: str) -> bool:
+    """Send welcome email to newly registered user."""
+    subject = "Willkommen bei Yellow-Boat Academy"
+    body = render_email_body("welcome", username=username)
+    return queue_email(user_email, subject, body)
+
+
+def send_trainer_welcome_email(trainer_email: str, trainer_name: str) -> bool:
+    """Send welcome email from Martin to newly registered trainer."""
+    subject = "Herzlich Willkommen bei Yellow-Boat Academy!"
+    body = render_email_body("trainer_welcome", trainer_name=trainer_name)
+    return queue_email(trainer_email, subject, body)
+
+
+def send_trainer_application_received(trainer_email: str, trainer_name: str) -> bool:
+    """Send confirmation email when trainer application is received."""
+    subject = "Deine Bewerbung ist eingegangen"
+    body = render_email_body("trainer_application_received", trainer_name=trainer_name)
+    return queue_email(trainer_email, subject, body)
+
+
+def send_trainer_application_accepted(trainer_email: str, trainer_name: str) -> bool:
+    """Send email when trainer application is accepted."""
+    subject = "Deine Bewerbung wurde angenommen"
+    body = render_email_body("trainer_application_accepted", trainer_name=trainer_name)
+    return queue_email(trainer_email, subject, body)
+
+
+def send_trainer_application_rejected(trainer_email: str, trainer_name: str, reason: Optional[str] = None) -> bool:
+    """Send email when trainer application is rejected."""
+    subject = "Rueckmeldung zu deiner Bewerbung"
+    body = render_email_body("trainer_application_rejected", trainer_name=trainer_name, reason=reason)
+    return queue_email(trainer_email, subject, body)
 
 
 def send_training_status_update(
@@ -172,36 +800,23 @@ def send_training_status_update(
     training_id: int
 ) -> bool:
     """Send email when training status changes."""
-    # Translate status names to German
-    status_names = {
-        "lead": "Lead",
-        "appointment_scheduled": "Termin vereinbart",
-        "initial_contact": "Erstkontakt",
-        "proposal_sent": "Angebot gesendet",
-        "trainer_outreach": "Trainer-Anfrage",
-        "trainer_confirmed": "Trainer bestaetigt",
-        "planning": "In Planung",
-        "delivered": "Durchgefuehrt",
-        "invoiced": "Abgerechnet"
-    }
-
-    old_status_name = status_names.get(old_status, old_status)
-    new_status_name = status_names.get(new_status, new_status)
-
     subject = f"Training Status-Update: {training_title}"
-    body = f"""Hallo {recipient_name},
+    body = f"Hallo {recipient_name},\n\n" + _render_status_update_body(
+        training_title, old_status, new_status, training_id
+    )
+    return queue_email(recipient_email, subject, body)
 
-der Status des Trainings "{training_title}" (ID: {training_id}) wurde aktualisiert:
 
-Alter Status: {old_status_name}
-Neuer Status: {new_status_name}
-
-Du kannst die Details im Backoffice einsehen.
-
-Viele Gruesse,
-Das Yellow-Boat Academy Team
-"""
-    return send_email(recipient_email, subject, body)
+@lru_cache(maxsize=1024)
+def _render_status_update_body(training_title: str, old_status: str, new_status: str, training_id: int) -> str:
+    # One status change is usually broadcast to several recipients
+    return render_email_body(
+        "training_status_update",
+        training_title=training_title,
+        training_id=training_id,
+        old_status_name=STATUS_NAMES_DE.get(old_status, old_status),
+        new_status_name=STATUS_NAMES_DE.get(new_status, new_status),
+    )
 
 
 def send_new_application_admin_notification(
@@ -212,20 +827,13 @@ def send_new_application_admin_notification(
 ) -> bool:
     """Send notification to admin when new trainer application is received."""
     subject = "Neue Trainer-Bewerbung eingegangen"
-    body = f"""Hallo,
-
-eine neue Trainer-Bewerbung ist eingegangen:
-
-Name: {trainer_name}
-E-Mail: {trainer_email}
-Bewerbungs-ID: {application_id}
-
-Bitte pruefe die Bewerbung im Admin-Bereich des Backoffice.
-
-Viele Gruesse,
-Yellow-Boat Academy System
-"""
-    return send_email(admin_email, subject, body)
+    body = render_email_body(
+        "new_application_admin_notification",
+        trainer_name=trainer_name,
+        trainer_email=trainer_email,
+        application_id=application_id,
+    )
+    return queue_email(admin_email, subject, body)
 
 
 def send_trainer_assigned_notification(
@@ -237,20 +845,14 @@ def send_trainer_assigned_notification(
 ) -> bool:
     """Send notification to trainer when assigned to a training."""
     subject = f"Du wurdest einem Training zugewiesen: {training_title}"
-    body = f"""Hallo {trainer_name},
-
-du wurdest einem neuen Training zugewiesen:
-
-Training: {training_title}
-Datum: {training_date}
-Kunde: {customer_name}
-
-Bitte pruefe die Details im Backoffice und bestatige deine Verfuegbarkeit.
-
-Viele Gruesse,
-Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
+    body = render_email_body(
+        "trainer_assigned",
+        trainer_name=trainer_name,
+        training_title=training_title,
+        training_date=training_date,
+        customer_name=customer_name,
+    )
+    return queue_email(trainer_email, subject, body)
 
 
 def send_training_reminder(
@@ -264,24 +866,16 @@ def send_training_reminder(
 ) -> bool:
     """Send reminder email to trainer one day before training."""
     subject = f"Erinnerung: Morgen Training - {training_title}"
-    body = f"""Hallo {trainer_name},
-
-dies ist eine Erinnerung an dein Training morgen:
-
-Training: {training_title}
-Datum: {training_date}
-Uhrzeit: {training_time}
-Ort: {location}
-Kunde: {customer_name}
-
-Bitte stelle sicher, dass du alle notwendigen Materialien vorbereitet hast.
-
-Bei Fragen oder Problemen kontaktiere uns bitte umgehend.
-
-Viele Gruesse,
-Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
+    body = render_email_body(
+        "training_reminder",
+        trainer_name=trainer_name,
+        training_title=training_title,
+        training_date=training_date,
+        training_time=training_time,
+        location=location,
+        customer_name=customer_name,
+    )
+    return queue_email(trainer_email, subject, body)
 
 
 # ============== Training Application Emails (for specific trainings) ==============
@@ -294,18 +888,13 @@ def send_training_application_submitted(
 ) -> bool:
     """Send confirmation email when trainer applies for a specific training."""
     subject = f"Bewerbung eingereicht: {training_title}"
-    body = f"""Hallo {trainer_name},
-
-deine Bewerbung fuer das Training "{training_title}" (ID: {training_id}) wurde erfolgreich eingereicht.
-
-Wir werden deine Bewerbung pruefen und dich ueber unsere Entscheidung informieren.
-
-Du kannst den Status deiner Bewerbung jederzeit im Backoffice einsehen.
-
-Viele Gruesse,
-Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
+    body = render_email_body(
+        "training_application_submitted",
+        trainer_name=trainer_name,
+        training_title=training_title,
+        training_id=training_id,
+    )
+    return queue_email(trainer_email, subject, body)
 
 
 def send_training_application_accepted(
@@ -317,29 +906,14 @@ def send_training_application_accepted(
 ) -> bool:
     """Send email when trainer's application for a specific training is accepted."""
     subject = f"Bewerbung angenommen: {training_title}"
-
-    details = ""
-    if training_date or customer_name:
-        details = "\n\nTraining-Details:\n"
-        if training_date:
-            details += f"Datum: {training_date}\n"
-        if customer_name:
-            details += f"Kunde: {customer_name}\n"
-
-    body = f"""Hallo {trainer_name},
-
-herzlichen Glueckwunsch! Deine Bewerbung fuer das Training "{training_title}" wurde angenommen.
-
-Du wurdest diesem Training zugewiesen.{details}
-
-Bitte pruefe die vollstaendigen Details im Backoffice und bestatige deine Verfuegbarkeit.
-
-Wir freuen uns auf die Zusammenarbeit!
-
-Viele Gruesse,
-Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
+    body = render_email_body(
+        "training_application_accepted",
+        trainer_name=trainer_name,
+        training_title=training_title,
+        training_date=training_date,
+        customer_name=customer_name,
+    )
+    return queue_email(trainer_email, subject, body)
 
 
 def send_training_application_rejected(
@@ -350,23 +924,13 @@ def send_training_application_rejected(
 ) -> bool:
     """Send email when trainer's application for a specific training is rejected."""
     subject = f"Rueckmeldung zu deiner Bewerbung: {training_title}"
-
-    reason_text = ""
-    if reason:
-        reason_text = f"\n\nBegruendung: {reason}\n"
-
-    body = f"""Hallo {trainer_name},
-
-vielen Dank fuer dein Interesse an dem Training "{training_title}".
-
-Leider koennen wir dir dieses Training derzeit nicht zuweisen.{reason_text}
-
-Es gibt regelmaessig neue Trainingsanfragen. Schau gerne im Backoffice nach weiteren Moeglichkeiten.
-
-Viele Gruesse,
-Das Yellow-Boat Academy Team
-"""
-    return send_email(trainer_email, subject, body)
+    body = render_email_body(
+        "training_application_rejected",
+        trainer_name=trainer_name,
+        training_title=training_title,
+        reason=reason,
+    )
+    return queue_email(trainer_email, subject, body)
 
 
 def send_training_application_admin_notification(
@@ -378,18 +942,11 @@ def send_training_application_admin_notification(
 ) -> bool:
     """Send notification to admin when a trainer applies for a training."""
     subject = f"Neue Trainerbewerbung fuer: {training_title}"
-    body = f"""Hallo,
-
-ein Trainer hat sich fuer ein Training beworben:
-
-Trainer: {trainer_name}
-Training: {training_title}
-Training-ID: {training_id}
-Bewerbungs-ID: {application_id}
-
-Bitte pruefe die Bewerbung im Admin-Bereich des Backoffice.
-
-Viele Gruesse,
-Yellow-Boat Academy System
-"""
-    return send_email(admin_email, subject, body)
+    body = render_email_body(
+        "training_application_admin_notification",
+        trainer_name=trainer_name,
+        training_title=training_title,
+        training_id=training_id,
+        application_id=application_id,
+    )
+    return queue_email(admin_email, subject, body)
@@ -1,21 +1,40 @@
 """Mailbox service for managing user emails and platform email addresses."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import re
 import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, lambda_stmt, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
 from ..config import settings
+from ..database import SessionLocal
 from ..models.user import User, MailboxEmail, EmailAttachment, EmailNotification
-from .email import send_email
+from ..utils.search import escape_like_wildcards
+from .email import OutgoingEmail, send_emails_async, send_emails_bulk_async
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_SUBJECT = "Neue E-Mail: {subject}"
+NOTIFICATION_BODY = """Hallo {name},
+
+du hast eine neue E-Mail in deinem Yellow-Boat Academy Postfach erhalten.
+
+Von: {sender}
+Betreff: {subject}
+
+Klicke hier, um die E-Mail zu lesen:
+{deep_link}
+
+Viele Gruesse,
+Yellow-Boat Academy
+"""
+
 
 def generate_platform_email(db: Session, last_name: str) -> str:
     """
@@ -23,33 +42,54 @@ def generate_platform_email(db: Session, last_name: str) -> str:
     If lastname is already taken, append incrementing numbers (1, 2, 3, etc.)
     """
     domain = settings.platform_email_domain
-    base_email = f"{last_name.lower().replace(' ', '-')}@{domain}"
-
-    # Check if base email is available
-    existing = db.query(User).filter(User.platform_email == base_email).first()
-    if not existing:
-        return base_email
-
-    # Find next available number
-    counter = 1
-    while True:
-        numbered_email = f"{last_name.lower().replace(' ', '-')}{counter}@{domain}"
-        existing = db.query(User).filter(User.platform_email == numbered_email).first()
-        if not existing:
-            return numbered_email
-        counter += 1
-        if counter > 1000:  # Safety limit
-            raise ValueError(f"Could not generate unique email for {last_name}")
-
-
-def assign_platform_email_to_user(db: Session, user: User, last_name: str) -> str:
-    """Assign a platform email address to a user."""
+    prefix = last_name.lower().replace(' ', '-')
+
+    # Fetch every taken "prefix<n>@domain" address in one query
+    pattern = f"{escape_like_wildcards(prefix)}%@{escape_like_wildcards(domain)}"
+    suffix_re = re.compile(rf"{re.escape(prefix)}(|[1-9]\d*)@{re.escape(domain)}")
+    taken = set()
+    for (address,) in db.query(User.platform_email).filter(User.platform_email.like(pattern, escape="\\")):
+        match = suffix_re.fullmatch(address)
+        if match:
+            taken.add(int(match.group(1) or 0))  # the base address counts as 0
+
+    if 0 not in taken:
+        return f"{prefix}@{domain}"
+
+    # Smallest free number; among 1..len(taken) at least one is free
+    counter = min(n for n in range(1, len(taken) + 1) if n not in taken)
+    if counter > 1000:  # Safety limit
+        raise ValueError(f"Could not generate unique email for {last_name}")
+    return f"{prefix}{counter}@{domain}"
+
+
+def assign_platform_email_to_user(db: Session, user: User, last_name: str, max_attempts: int = 5) -> str:
+    """
+    Assign a platform email address to a user.
+
+    A concurrent registration can take the same address between the scan and
+    our write; the unique constraint catches that, and we roll back to the
+    savepoint and try again with a fresh scan.
+    """
     if user.platform_email:
         return user.platform_email
 
-    platform_email = generate_platform_email(db, last_name)
-    user.platform_email = platform_email
-    user.last_name = last_name
+    for _ in range(max_attempts):
+        platform_email = generate_platform_email(db, last_name)
+        savepoint = db.begin_nested()
+        user.platform_email = platform_email
+        user.last_name = last_name
+        try:
+            db.flush()
+        except IntegrityError:
+            savepoint.rollback()
+            logger.info(f"Platform email {platform_email} was taken concurrently, retrying")
+            continue
+        savepoint.commit()
+        break
+    else:
+        raise ValueError(f"Could not assign a platform email for {last_name}")
+
     db.commit()
     db.refresh(user)
 
@@ -59,7 +99,8 @@ def assign_platform_email_to_user(db: Session, user: User, last_name: str) -> st
 
 def get_user_by_platform_email(db: Session, platform_email: str) -> Optional[User]:
     """Find user by their platform email address."""
-    return db.query(User).filter(User.platform_email == platform_email).first()
+    stmt = lambda_stmt(lambda: select(User).where(User.platform_email == platform_email).limit(1))
+    return db.scalars(stmt).first()
 
 
 def generate_message_id() -> str:
@@ -83,8 +124,58 @@ def create_email(
     direction: str = "outbound",
     folder: str = "sent",
     is_draft: bool = False,
+    refresh: bool = True,
+) -> MailboxEmail:
+    """
+    Create a new email in the mailbox.
+
+    Pass refresh=False when the caller only needs what it already set plus the
+    id, which the INSERT assigns.
+    """
+    email = _build_email(
+        db,
+        owner_id=owner_id,
+        from_address=from_address,
+        to_addresses=to_addresses,
+        subject=subject,
+        body_text=body_text,
+        body_html=body_html,
+        cc_addresses=cc_addresses,
+        bcc_addresses=bcc_addresses,
+        from_name=from_name,
+        in_reply_to=in_reply_to,
+        thread_id=thread_id,
+        direction=direction,
+        folder=folder,
+        is_draft=is_draft,
+    )
+
+    db.add(email)
+    db.commit()
+    if refresh:
+        db.refresh(email)
+
+    return email
+
+
+def _build_email(
+    db: Session,
+    owner_id: int,
+    from_address: str,
+    to_addresses: list[str],
+    subject: str,
+    body_text: str,
+    body_html: Optional[str] = None,
+    cc_addresses: Optional[list[str]] = None,
+    bcc_addresses: Optional[list[str]] = None,
+    from_name: Optional[str] = None,
+    in_reply_to: Optional[str] = None,
+    thread_id: Optional[str] = None,
+    direction: str = "outbound",
+    folder: str = "sent",
+    is_draft: bool = False,
 ) -> MailboxEmail:
-    """Create a new email in the mailbox."""
+    """Build a new, unsaved mailbox email."""
     message_id = generate_message_id()
 
     # If replying, use same thread_id, otherwise generate new one
@@ -96,16 +187,16 @@ def create_email(
     if not thread_id:
         thread_id = message_id
 
-    email = MailboxEmail(
+    return MailboxEmail(
         owner_id=owner_id,
         message_id=message_id,
         in_reply_to=in_reply_to,
         thread_id=thread_id,
         from_address=from_address,
         from_name=from_name,
-        to_addresses=json.dumps(to_addresses),
-        cc_addresses=json.dumps(cc_addresses) if cc_addresses else None,
-        bcc_addresses=json.dumps(bcc_addresses) if bcc_addresses else None,
+        to_addresses=to_addresses,
+        cc_addresses=cc_addresses or [],
+        bcc_addresses=bcc_addresses or [],
         subject=subject,
         body_text=body_text,
         body_html=body_html,
@@ -115,14 +206,8 @@ def create_email(
         sent_at=datetime.utcnow() if not is_draft else None,
     )
 
-    db.add(email)
-    db.commit()
-    db.refresh(email)
-
-    return email
-
 
-def send_platform_email(
+async def send_platform_email(
     db: Session,
     sender_user: User,
     to_addresses: list[str],
@@ -154,19 +239,19 @@ def send_platform_email(
         in_reply_to=in_reply_to,
         direction="outbound",
         folder="sent",
+        refresh=False,
     )
 
     # Deliver to platform users (create inbound copy in their mailbox)
     all_recipients = to_addresses + (cc_addresses or [])
-    for recipient_address in all_recipients:
-        recipient_user = get_user_by_platform_email(db, recipient_address)
-        if recipient_user:
-            # Create inbound copy for platform user
-            inbound_email = create_email(
-                db=db,
+    recipient_users = db.query(User).filter(User.platform_email.in_(all_recipients)).all()
+    if recipient_users:
+        inbound_emails = [
+            _build_email(
+                db,
                 owner_id=recipient_user.id,
                 from_address=sender_user.platform_email,
-                from_name=f"{sender_user.first_name or ''} {sender_user.last_name or ''}".strip() or sender_user.username,
+                from_name=outbound_email.from_name,
                 to_addresses=to_addresses,
                 cc_addresses=cc_addresses,
                 subject=subject,
@@ -177,86 +262,182 @@ def send_platform_email(
                 direction="inbound",
                 folder="inbox",
             )
+            for recipient_user in recipient_users
+        ]
+        db.add_all(inbound_emails)
+        # One multi-row INSERT; assigns the ids needed for the deep links
+        db.flush()
 
-            # Create notification and send to user's personal email
-            send_email_notification(db, recipient_user, inbound_email)
+        # Create notifications; they are sent to the users' personal email in the background
+        await queue_email_notifications(db, list(zip(recipient_users, inbound_emails)))
 
-    # Also try to send via SMTP to external addresses
-    for recipient_address in all_recipients:
-        if not recipient_address.endswith(f"@{settings.platform_email_domain}"):
-            # External recipient - send via SMTP
-            send_email(recipient_address, subject, body_text)
+    # Also try to send via SMTP to external addresses, all over one session
+    domain_suffix = f"@{settings.platform_email_domain}"
+    external_recipients = [address for address in all_recipients if not address.endswith(domain_suffix)]
+    if external_recipients:
+        await send_emails_async(external_recipients, subject, body_text)
 
     return True, outbound_email
 
 
-def send_email_notification(db: Session, user: User, email: MailboxEmail) -> bool:
-    """Send notification to user's personal email about new platform email."""
-    if not user.email:
-        return False
-
-    deep_link = f"{settings.frontend_base_url}/mailbox/{email.id}"
-
-    # Create notification record
-    notification = EmailNotification(
-        user_id=user.id,
-        email_id=email.id,
-        deep_link=deep_link,
-    )
-    db.add(notification)
-
-    # Send notification email
-    subject = f"Neue E-Mail: {email.subject or '(Kein Betreff)'}"
-    body = f"""Hallo {user.first_name or user.username},
+async def queue_email_notifications(db: Session, deliveries: list[tuple[User, MailboxEmail]]) -> int:
+    """
+    Notify users on their personal email about new platform emails.
 
-du hast eine neue E-Mail in deinem Yellow-Boat Academy Postfach erhalten.
+    Creates one EmailNotification per (user, email) pair and commits them;
+    the notification emails are then sent by a background task, so the
+    caller doesn't wait for SMTP. Returns the number of notifications created.
+    """
+    notifications = [
+        EmailNotification(
+            user_id=user.id,
+            email_id=email.id,
+            deep_link=f"{settings.frontend_base_url}/mailbox/{email.id}",
+        )
+        for user, email in deliveries
+        if user.email
+    ]
+    if not notifications:
+        db.commit()
+        return 0
+
+    db.add_all(notifications)
+    db.flush()
+    notification_ids = [notification.id for notification in notifications]
+    db.commit()
 
-Von: {email.from_name or email.from_address}
-Betreff: {email.subject or '(Kein Betreff)'}
+    task = asyncio.get_running_loop().create_task(deliver_email_notifications(notification_ids))
+    _delivery_tasks.add(task)
+    task.add_done_callback(_delivery_tasks.discard)
+    return len(notifications)
 
-Klicke hier, um die E-Mail zu lesen:
-{deep_link}
 
-Viele Gruesse,
-Yellow-Boat Academy
-"""
+# The event loop only keeps weak references to tasks
+_delivery_tasks: set[asyncio.Task] = set()
 
-    success = send_email(user.email, subject, body)
 
-    if success:
-        notification.notification_sent = True
-        notification.sent_at = datetime.utcnow()
+async def deliver_email_notifications(notification_ids: list[int]) -> int:
+    """
+    Send the notification emails and mark the sent ones in a single UPDATE.
 
-    db.commit()
-    return success
+    The database work runs in worker threads so it doesn't block the event
+    loop. Returns the number of notifications sent.
+    """
+    messages = await asyncio.to_thread(_load_notification_messages, notification_ids)
+    await send_emails_bulk_async(messages.values())
+
+    sent_ids = [notification_id for notification_id, message in messages.items() if message.sent]
+    if sent_ids:
+        await asyncio.to_thread(_mark_notifications_sent, sent_ids)
+    return len(sent_ids)
+
+
+def _load_notification_messages(notification_ids: list[int]) -> dict[int, OutgoingEmail]:
+    """Build the notification emails, keyed by notification id, with one joined query."""
+    with SessionLocal() as db:
+        rows = (
+            db.query(EmailNotification.id, EmailNotification.deep_link, User, MailboxEmail.from_name,
+                     MailboxEmail.from_address, MailboxEmail.subject)
+            .join(User, EmailNotification.user_id == User.id)
+            .join(MailboxEmail, EmailNotification.email_id == MailboxEmail.id)
+            .filter(EmailNotification.id.in_(notification_ids))
+            .all()
+        )
+
+    messages = {}
+    for notification_id, deep_link, user, from_name, from_address, email_subject in rows:
+        fields = {
+            "name": user.first_name or user.username,
+            "sender": from_name or from_address,
+            "subject": email_subject or "(Kein Betreff)",
+            "deep_link": deep_link,
+        }
+        messages[notification_id] = OutgoingEmail(
+            user.email,
+            NOTIFICATION_SUBJECT.format_map(fields),
+            NOTIFICATION_BODY.format_map(fields),
+        )
+    return messages
+
+
+def _mark_notifications_sent(notification_ids: list[int]) -> None:
+    with SessionLocal() as db:
+        db.query(EmailNotification).filter(EmailNotification.id.in_(notification_ids)).update(
+            {
+                EmailNotification.notification_sent: True,
+                EmailNotification.sent_at: datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+        db.commit()
 
 
 def get_user_emails(
     db: Session,
     user_id: int,
     folder: str = "inbox",
-    skip: int = 0,
+    after: Optional[tuple[datetime, int]] = None,
     limit: int = 50,
     unread_only: bool = False,
 ) -> list[MailboxEmail]:
-    """Get emails for a user in a specific folder."""
-    query = db.query(MailboxEmail).filter(
-        MailboxEmail.owner_id == user_id,
-        MailboxEmail.folder == folder,
+    """
+    Get emails for a user in a specific folder, newest first.
+
+    Paginated by keyset: pass the (received_at, id) of the last email of the
+    previous page as `after`. Only the columns of the list view are loaded,
+    not the email bodies.
+    """
+    stmt = lambda_stmt(
+        lambda: select(MailboxEmail).options(
+            load_only(
+                MailboxEmail.id,
+                MailboxEmail.message_id,
+                MailboxEmail.thread_id,
+                MailboxEmail.from_address,
+                MailboxEmail.from_name,
+                MailboxEmail.to_addresses,
+                MailboxEmail.subject,
+                MailboxEmail.folder,
+                MailboxEmail.is_read,
+                MailboxEmail.is_starred,
+                MailboxEmail.is_draft,
+                MailboxEmail.direction,
+                MailboxEmail.sent_at,
+                MailboxEmail.received_at,
+            )
+        ).where(
+            MailboxEmail.owner_id == user_id,
+            MailboxEmail.folder == folder,
+        )
     )
 
     if unread_only:
-        query = query.filter(MailboxEmail.is_read == False)
+        stmt += lambda s: s.where(MailboxEmail.is_read == False)
+
+    return _page(db, stmt, after, limit)
+
 
-    return query.order_by(MailboxEmail.received_at.desc()).offset(skip).limit(limit).all()
+def _page(db: Session, stmt, after: Optional[tuple[datetime, int]], limit: int) -> list[MailboxEmail]:
+    """Return the page of emails after the (received_at, id) keyset, newest first."""
+    if after is not None:
+        after_received_at, after_id = after
+        stmt += lambda s: s.where(
+            tuple_(MailboxEmail.received_at, MailboxEmail.id) < tuple_(after_received_at, after_id)
+        )
+
+    stmt += lambda s: s.order_by(MailboxEmail.received_at.desc(), MailboxEmail.id.desc()).limit(limit)
+    return list(db.scalars(stmt))
 
 
 def get_email_by_id(db: Session, email_id: int, user_id: int) -> Optional[MailboxEmail]:
     """Get a specific email by ID, ensuring it belongs to the user."""
-    return db.query(MailboxEmail).filter(
-        MailboxEmail.id == email_id,
-        MailboxEmail.owner_id == user_id,
-    ).first()
+    stmt = lambda_stmt(
+        lambda: select(MailboxEmail).where(
+            MailboxEmail.id == email_id,
+            MailboxEmail.owner_id == user_id,
+        )
+    )
+    return db.scalars(stmt).first()
 
 
 def mark_email_as_read(db: Session, email: MailboxEmail) -> MailboxEmail:
@@ -295,39 +476,37 @@ def get_email_thread(db: Session, thread_id: str, user_id: int) -> list[MailboxE
 
 def get_all_emails_for_admin(
     db: Session,
-    skip: int = 0,
+    after: Optional[tuple[datetime, int]] = None,
     limit: int = 100,
     user_id_filter: Optional[int] = None,
 ) -> list[MailboxEmail]:
-    """Get all emails for admin/backoffice view (excluding the viewer's own emails)."""
-    query = db.query(MailboxEmail)
+    """
+    Get all emails for admin/backoffice view (excluding the viewer's own emails).
+
+    Paginated by keyset like get_user_emails.
+    """
+    stmt = lambda_stmt(lambda: select(MailboxEmail))
 
     if user_id_filter:
-        query = query.filter(MailboxEmail.owner_id != user_id_filter)
+        stmt += lambda s: s.where(MailboxEmail.owner_id != user_id_filter)
 
-    return query.order_by(MailboxEmail.received_at.desc()).offset(skip).limit(limit).all()
+    return _page(db, stmt, after, limit)
 
 
 def get_email_stats(db: Session, user_id: int) -> dict:
     """Get email statistics for a user."""
-    unread_count = db.query(func.count(MailboxEmail.id)).filter(
-        MailboxEmail.owner_id == user_id,
-        MailboxEmail.folder == "inbox",
-        MailboxEmail.is_read == False,
-    ).scalar()
-
-    inbox_count = db.query(func.count(MailboxEmail.id)).filter(
-        MailboxEmail.owner_id == user_id,
-        MailboxEmail.folder == "inbox",
-    ).scalar()
-
-    sent_count = db.query(func.count(MailboxEmail.id)).filter(
-        MailboxEmail.owner_id == user_id,
-        MailboxEmail.folder == "sent",
-    ).scalar()
+    # All three counts in one scan over the user's emails
+    stmt = lambda_stmt(
+        lambda: select(
+            func.sum(case((and_(MailboxEmail.folder == "inbox", MailboxEmail.is_read == False), 1), else_=0)).label("unread"),
+            func.sum(case((MailboxEmail.folder == "inbox", 1), else_=0)).label("inbox"),
+            func.sum(case((MailboxEmail.folder == "sent", 1), else_=0)).label("sent"),
+        ).where(MailboxEmail.owner_id == user_id)
+    )
+    row = db.execute(stmt).one()
 
     return {
-        "unread": unread_count,
-        "inbox": inbox_count,
-        "sent": sent_count,
+        "unread": row.unread or 0,
+        "inbox": row.inbox or 0,
+        "sent": row.sent or 0,
     }
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing dependency for a while.
+
+    CLOSED: calls go through. After failure_threshold consecutive failures the
+    circuit goes OPEN and calls are refused for reset_timeout seconds. Then it
+    is HALF_OPEN: one trial call is let through, and its outcome closes or
+    re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return
+        raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, selectinload
 
 from ..models import Customer, Trainer, Training
 
+# Shared by all requests; each search uses three workers
+_search_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="search")
+
 
 def escape_like_wildcards(value: str) -> str:
     """Escape SQL LIKE wildcards to prevent LIKE-injection attacks.
@@ -18,43 +23,44 @@ def escape_like_wildcards(value: str) -> str:
     return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
 
 
-def search_everywhere(session: Session, query: str):
-    # Escape LIKE wildcards to prevent injection
-    escaped_query = escape_like_wildcards(query.lower())
-    like_query = f"%{escaped_query}%"
+def contains_ignore_case(column, value: str):
+    """Case-insensitive substring filter: lower(column) LIKE '%value%'.
 
+    The value is escaped with escape_like_wildcards(); all LIKE searches
+    should go through here so the escaping can't be forgotten.
+    """
+    return func.lower(column).like(f"%{escape_like_wildcards(value.lower())}%", escape="\\")
+
+
+def search_everywhere(session: Session, query: str):
+    # On PostgreSQL every matched column has a GIN trigram index on
+    # lower(column) (migration 005), which serves these '%...%' patterns
     def _match(column):
-        return func.lower(column).like(like_query)
+        return contains_ignore_case(column, query)
 
-    customers = (
-        session.query(Customer)
-        .filter(
-            or_(
-                _match(Customer.company_name),
-                _match(Customer.contact_name),
-                _match(Customer.contact_email),
-                _match(Customer.tags),
-            )
+    customers = select(Customer).where(
+        or_(
+            _match(Customer.company_name),
+            _match(Customer.first_name),
+            _match(Customer.last_name),
+            _match(Customer.contact_email),
+            _match(Customer.tags),
         )
-        .all()
     )
 
-    trainers = (
-        session.query(Trainer)
-        .filter(
-            or_(
-                _match(Trainer.first_name),
-                _match(Trainer.last_name),
-                _match(Trainer.email),
-                _match(Trainer.tags),
-            )
+    trainers = select(Trainer).where(
+        or_(
+            _match(Trainer.first_name),
+            _match(Trainer.last_name),
+            _match(Trainer.email),
+            _match(Trainer.tags),
         )
-        .all()
     )
 
     trainings = (
-        session.query(Training)
-        .filter(
+        select(Training)
+        .options(selectinload(Training.tasks))
+        .where(
             or_(
                 _match(Training.title),
                 _match(Training.location),
@@ -62,7 +68,15 @@ def search_everywhere(session: Session, query: str):
                 _match(Training.internal_notes),
             )
         )
-        .all()
     )
 
-    return customers, trainers, trainings
+    # The three queries are independent, so run them concurrently, each on its
+    # own session; the returned objects are detached but fully loaded
+    bind = session.get_bind()
+
+    def _run(statement):
+        with Session(bind=bind, expire_on_commit=False) as worker_session:
+            return worker_session.scalars(statement).all()
+
+    futures = [_search_executor.submit(_run, statement) for statement in (customers, trainers, trainings)]
+    return tuple(future.result() for future in futures)
@@ -59,10 +59,13 @@ def cleanup_database():
         print("\n--- Current Database State ---")
         print(f"Users: {db.query(User).count()}")
         print(f"Trainers: {db.query(Trainer).count()}")
-        print(f"TrainerRegistrations (Applications): {db.query(TrainerRegistration).count()}")
-        print(f"TrainerApplications (for Trainings): {db.query(TrainerApplication).count()}")
+        registration_count = db.query(TrainerRegistration).count()
+        application_count = db.query(TrainerApplication).count()
+        activity_log_count = db.query(ActivityLog).count()
+        print(f"TrainerRegistrations (Applications): {registration_count}")
+        print(f"TrainerApplications (for Trainings): {application_count}")
         print(f"Messages: {db.query(Message).count()}")
-        print(f"ActivityLogs: {db.query(ActivityLog).count()}")
+        print(f"ActivityLogs: {activity_log_count}")
 
         # List all trainer registrations
         print("\n--- Trainer Registrations (to be deleted) ---")
@@ -85,16 +88,25 @@ def cleanup_database():
             return
 
         print("\n--- Starting Cleanup ---")
-
-        # 2. Delete all TrainerApplications (for specific trainings)
-        count = db.query(TrainerApplication).delete()
-        print(f"Deleted {count} TrainerApplications")
-
-        # 3. Delete all TrainerRegistrations (public applications)
-        count = db.query(TrainerRegistration).delete()
-        print(f"Deleted {count} TrainerRegistrations")
-
-        # 4. Delete all Messages (except from/to admin)
+        # Everything below runs in one transaction, committed at the end
+
+        # 2. Empty TrainerApplications (for specific trainings), TrainerRegistrations
+        #    (public applications) and ActivityLogs
+        if engine.dialect.name == "postgresql":
+            # TRUNCATE drops the rows without a per-row delete and scan
+            db.execute(text(
+                "TRUNCATE trainer_applications, trainer_registrations, activity_logs "
+                "RESTART IDENTITY CASCADE"
+            ))
+        else:
+            db.query(TrainerApplication).delete()
+            db.query(TrainerRegistration).delete()
+            db.query(ActivityLog).delete()
+        print(f"Deleted {application_count} TrainerApplications")
+        print(f"Deleted {registration_count} TrainerRegistrations")
+        print(f"Deleted {activity_log_count} ActivityLogs")
+
+        # 3. Delete all Messages (except from/to admin)
         if admin_id:
             count = db.query(Message).filter(
                 Message.sender_id != admin_id,
@@ -104,15 +116,13 @@ def cleanup_database():
             count = db.query(Message).delete()
         print(f"Deleted {count} Messages")
 
-        # 5. Delete all ActivityLogs
-        count = db.query(ActivityLog).delete()
-        print(f"Deleted {count} ActivityLogs")
-
-        # 6. Unassign trainers from trainings
-        db.query(Training).update({Training.trainer_id: None})
+        # 4. Unassign trainers from trainings (only rows that have one)
+        db.query(Training).filter(Training.trainer_id.isnot(None)).update(
+            {Training.trainer_id: None}, synchronize_session=False
+        )
         print("Unassigned all trainers from trainings")
 
-        # 7. Delete all Trainers (except admin's trainer profile if exists)
+        # 5. Delete all Trainers (except admin's trainer profile if exists)
         if admin_id:
             admin_trainer = db.query(Trainer).filter(Trainer.user_id == admin_id).first()
             if admin_trainer:
@@ -125,7 +135,7 @@ def cleanup_database():
             count = db.query(Trainer).delete()
             print(f"Deleted {count} Trainers")
 
-        # 8. Delete all Users except admin
+        # 6. Delete all Users except admin
         if admin_id:
             count = db.query(User).filter(User.id != admin_id).delete()
         else:
@@ -12,19 +12,30 @@ Environment variables required:
     ALWAYSDATA_API_KEY - Your AlwaysData API key
     ALWAYSDATA_ACCOUNT - Your AlwaysData account name (default: y-b)
     ALWAYSDATA_DOMAIN_ID - The domain ID for yellow-boat.org (or 0 to auto-detect)
+
+Auto-detected domain IDs are cached for a day in ~/.cache/yb-setup/domains.json.
 """
 
 import os
 import sys
+import json
 import logging
 import secrets
 import string
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -32,13 +43,43 @@ ALWAYSDATA_API_URL = "https://api.alwaysdata.com/v1"
 PLATFORM_DOMAIN = "yellow-boat.org"
 NOREPLY_EMAIL_NAME = "noreply"
 
+# After 3 consecutive 5xx responses or timeouts, fail fast for 30 seconds
+API_BREAKER = CircuitBreaker("AlwaysData API", failure_threshold=3, reset_timeout=30.0)
+
+# Domain name -> id lookups are cached on disk between runs
+DOMAIN_CACHE_FILE = Path.home() / ".cache" / "yb-setup" / "domains.json"
+DOMAIN_CACHE_TTL = 24 * 60 * 60  # seconds
+
+PASSWORD_ALPHABET = string.ascii_letters + string.digits + "!@#$%^&*"
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(PASSWORD_ALPHABET)
+
+# Transient API errors are retried with exponential backoff (0.5s, 1s, 2s, 4s plus jitter)
+API_RETRY = Retry(
+    total=4,
+    backoff_factor=0.5,
+    backoff_jitter=0.25,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "POST"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
 
 def generate_secure_password(length: int = 24) -> str:
     """Generate a secure random password."""
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # One CSPRNG draw per round instead of one per character; bytes above the
+    # largest multiple of the alphabet size are dropped to stay uniform.
+    chars: list[str] = []
+    while len(chars) < length:
+        chars.extend(
+            PASSWORD_ALPHABET[b % len(PASSWORD_ALPHABET)]
+            for b in secrets.token_bytes(length)
+            if b < _PASSWORD_BYTE_LIMIT
+        )
+    return ''.join(chars[:length])
 
 
+@lru_cache(maxsize=1)
 def get_api_auth() -> tuple:
     """Get API authentication tuple for requests."""
     api_key = os.environ.get('ALWAYSDATA_API_KEY', '')
@@ -50,55 +91,103 @@ def get_api_auth() -> tuple:
     return (f"{api_key} account={account}", "")
 
 
+@lru_cache(maxsize=1)
+def get_session() -> requests.Session:
+    """
+    Get the shared API session.
+
+    All calls go through one connection pool, so the TLS handshake with the
+    API happens once per run instead of once per request.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=API_RETRY))
+    session.auth = get_api_auth()
+    return session
+
+
+def api_request(method: str, path: str, **kwargs) -> requests.Response:
+    """Call the AlwaysData API through the shared session, guarded by the circuit breaker."""
+    API_BREAKER.before_call()
+    try:
+        response = get_session().request(method, f"{ALWAYSDATA_API_URL}{path}", timeout=30, **kwargs)
+    except requests.exceptions.RequestException:
+        API_BREAKER.record_failure()
+        raise
+    if response.status_code >= 500:
+        API_BREAKER.record_failure()
+    else:
+        API_BREAKER.record_success()
+    return response
+
+
+def _read_domain_cache() -> dict:
+    """Return the cached domain ids, or an empty dict if the cache is missing or stale."""
+    try:
+        if time.time() - DOMAIN_CACHE_FILE.stat().st_mtime < DOMAIN_CACHE_TTL:
+            return json.loads(DOMAIN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _write_domain_cache(domain_ids: dict) -> None:
+    """Replace the domain id cache atomically."""
+    try:
+        DOMAIN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = DOMAIN_CACHE_FILE.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(domain_ids))
+        tmp_file.replace(DOMAIN_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write domain cache: {e}")
+
+
 def get_domain_id(domain_name: str) -> int:
     """Get the AlwaysData domain ID for a domain name."""
+    cached_id = _read_domain_cache().get(domain_name)
+    if cached_id:
+        return cached_id
+
     try:
-        response = requests.get(
-            f"{ALWAYSDATA_API_URL}/domain/",
-            auth=get_api_auth(),
-            timeout=30
-        )
+        response = api_request("GET", "/domain/")
         if response.status_code == 200:
             domains = response.json()
+            _write_domain_cache({domain.get("name"): domain.get("id") for domain in domains})
             for domain in domains:
                 if domain.get("name") == domain_name:
                     return domain.get("id")
         logger.error(f"Domain {domain_name} not found. Available domains: {response.json()}")
         return 0
-    except Exception as e:
+    except (requests.exceptions.RequestException, CircuitOpenError) as e:
         logger.error(f"Error getting domain ID: {e}")
         return 0
 
 
+@lru_cache(maxsize=1)
 def list_existing_mailboxes() -> list:
-    """List all existing mailboxes to check for duplicates."""
+    """List all existing mailboxes to check for duplicates (fetched once per run)."""
     try:
-        response = requests.get(
-            f"{ALWAYSDATA_API_URL}/mailbox/",
-            auth=get_api_auth(),
-            timeout=30
-        )
+        response = api_request("GET", "/mailbox/")
         if response.status_code == 200:
             return response.json()
         return []
-    except Exception as e:
+    except (requests.exceptions.RequestException, CircuitOpenError) as e:
         logger.error(f"Error listing mailboxes: {e}")
         return []
 
 
-def mailbox_exists(email_name: str, domain_id: int) -> bool:
-    """Check if a mailbox already exists."""
-    mailboxes = list_existing_mailboxes()
-    for mailbox in mailboxes:
-        if mailbox.get("name") == email_name:
-            # Check if it's for the same domain
-            mailbox_domain = mailbox.get("domain", {})
-            if isinstance(mailbox_domain, dict):
-                if mailbox_domain.get("id") == domain_id:
-                    return True
-            elif mailbox_domain == domain_id:
-                return True
-    return False
+def mailbox_exists(email_name: str, domain_id: int, mailboxes: list | None = None) -> bool:
+    """Check if a mailbox already exists, optionally in an already fetched mailbox list."""
+    if mailboxes is None:
+        mailboxes = list_existing_mailboxes()
+    # The API returns the domain either as a nested object or as a plain id
+    existing = {
+        (
+            mailbox.get("name"),
+            mailbox["domain"].get("id") if isinstance(mailbox.get("domain"), dict) else mailbox.get("domain"),
+        )
+        for mailbox in mailboxes
+    }
+    return (email_name, domain_id) in existing
 
 
 def create_noreply_mailbox(domain_id: int, password: str) -> tuple:
@@ -109,15 +198,14 @@ def create_noreply_mailbox(domain_id: int, password: str) -> tuple:
         Tuple of (success, email_address, password)
     """
     try:
-        response = requests.post(
-            f"{ALWAYSDATA_API_URL}/mailbox/",
-            auth=get_api_auth(),
+        response = api_request(
+            "POST",
+            "/mailbox/",
             json={
                 "name": NOREPLY_EMAIL_NAME,
                 "domain": domain_id,
                 "password": password
             },
-            timeout=30
         )
 
         if response.status_code in (200, 201):
@@ -128,7 +216,7 @@ def create_noreply_mailbox(domain_id: int, password: str) -> tuple:
             logger.error(f"Failed to create mailbox: {response.status_code} - {response.text}")
             return False, None, None
 
-    except Exception as e:
+    except (requests.exceptions.RequestException, CircuitOpenError) as e:
         logger.error(f"Error creating mailbox: {e}")
         return False, None, None
 
@@ -154,21 +242,28 @@ def main():
     # Get domain ID
     domain_id = int(os.environ.get('ALWAYSDATA_DOMAIN_ID', 0))
 
-    if domain_id == 0:
-        print(f"Looking up domain ID for {PLATFORM_DOMAIN}...")
-        domain_id = get_domain_id(PLATFORM_DOMAIN)
+    # The domain lookup and the mailbox listing are independent, so fetch them in parallel
+    get_session()  # create the shared session before the worker threads use it
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mailboxes_future = executor.submit(list_existing_mailboxes)
 
         if domain_id == 0:
-            print(f"ERROR: Could not find domain {PLATFORM_DOMAIN}")
-            print("Please check your AlwaysData account has this domain configured.")
-            sys.exit(1)
+            print(f"Looking up domain ID for {PLATFORM_DOMAIN}...")
+            domain_id = executor.submit(get_domain_id, PLATFORM_DOMAIN).result()
+
+            if domain_id == 0:
+                print(f"ERROR: Could not find domain {PLATFORM_DOMAIN}")
+                print("Please check your AlwaysData account has this domain configured.")
+                sys.exit(1)
+
+            print(f"Found domain ID: {domain_id}")
 
-        print(f"Found domain ID: {domain_id}")
+        mailboxes = mailboxes_future.result()
 
     # Check if mailbox already exists
     print(f"Checking if {NOREPLY_EMAIL_NAME}@{PLATFORM_DOMAIN} already exists...")
 
-    if mailbox_exists(NOREPLY_EMAIL_NAME, domain_id):
+    if mailbox_exists(NOREPLY_EMAIL_NAME, domain_id, mailboxes):
         print()
         print(f"Mailbox {NOREPLY_EMAIL_NAME}@{PLATFORM_DOMAIN} already exists!")
         print("No action needed.")
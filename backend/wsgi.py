@@ -4,12 +4,14 @@ import site
 from pathlib import Path
 
 # Add user site-packages for pip --user installed packages
-user_site = Path.home() / ".local/lib/python3.11/site-packages"
-if user_site.exists():
-    site.addsitedir(str(user_site))
+user_site = str(Path.home() / ".local/lib/python3.11/site-packages")
+if user_site not in sys.path and Path(user_site).exists():
+    site.addsitedir(user_site)
 
-# Add backend to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add backend to Python path (only once if the module is loaded again)
+backend_dir = str(Path(__file__).parent)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
 
 # Import Flask app
 from app.flask_app import application